@@ -1,3 +1,6 @@
+from functools import lru_cache
+from pathlib import Path
+
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 
@@ -6,25 +9,29 @@ from app.api.dependencies import frontend_dist
 router = APIRouter()
 
 
+@lru_cache(maxsize=8)
+def _frontend_page_exists(name: str) -> bool:
+    # The frontend build never changes while the process runs, so the
+    # per-request stat() syscall is paid once per page and memoized.
+    return (frontend_dist / name).exists()
+
+
+def _resolve_frontend(name: str, missing_detail: str) -> Path:
+    if not _frontend_page_exists(name):
+        raise HTTPException(status_code=404, detail=missing_detail)
+    return frontend_dist / name
+
+
 @router.get("/", include_in_schema=False)
 def index() -> FileResponse:
-    html_path = frontend_dist / "index.html"
-    if not html_path.exists():
-        raise HTTPException(status_code=404, detail="Frontend not built yet")
-    return FileResponse(html_path)
+    return FileResponse(_resolve_frontend("index.html", "Frontend not built yet"))
 
 
 @router.get("/login", include_in_schema=False)
 def login_page() -> FileResponse:
-    html_path = frontend_dist / "login.html"
-    if not html_path.exists():
-        raise HTTPException(status_code=404, detail="Login page not built yet")
-    return FileResponse(html_path)
+    return FileResponse(_resolve_frontend("login.html", "Login page not built yet"))
 
 
 @router.get("/config", include_in_schema=False)
 def config_page() -> FileResponse:
-    html_path = frontend_dist / "config.html"
-    if not html_path.exists():
-        raise HTTPException(status_code=404, detail="Config page not built yet")
-    return FileResponse(html_path)
+    return FileResponse(_resolve_frontend("config.html", "Config page not built yet"))
@@ -15,6 +15,9 @@ class Settings:
     juan_station_id: str
     cache_freshness_seconds: int
     station_catalog_freshness_seconds: int
+    # How long past freshness a cached window may still be served while a
+    # background refresh runs (stale-while-revalidate).
+    cache_stale_seconds: int = 6 * 60 * 60
     api_auth_enabled: bool = True
     api_auth_username: str = "analyst"
     api_auth_password: str = "antarctic"
@@ -27,12 +30,26 @@ class Settings:
 
 
 def _strip_wrapping_quotes(value: str) -> str:
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in {"'", '"'}:
+    # value[:1] never raises on empty strings, and the common unquoted case
+    # short-circuits on the first test. The length check stays so a lone
+    # quote character is returned untouched.
+    first = value[:1]
+    if first in ("'", '"') and len(value) >= 2 and value[-1] == first:
         return value[1:-1]
     return value
 
 
+_dotenv_loaded = False
+
+
 def _load_dotenv_if_present() -> None:
+    # The .env contents cannot change under a running process in any way we
+    # support, so the file probing and parsing happen once; later calls
+    # (e.g. after clear_settings_cache) cost a single bool check.
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
     env_paths = [
         Path.cwd() / ".env",
         Path(__file__).resolve().parents[3] / ".env",
@@ -88,6 +105,7 @@ def get_settings() -> Settings:
         gabriel_station_id=os.getenv("AEMET_GABRIEL_STATION_ID", "89070"),
         juan_station_id=os.getenv("AEMET_JUAN_STATION_ID", "89064"),
         cache_freshness_seconds=int(os.getenv("CACHE_FRESHNESS_SECONDS", str(3 * 60 * 60))),
+        cache_stale_seconds=int(os.getenv("CACHE_STALE_SECONDS", str(6 * 60 * 60))),
         station_catalog_freshness_seconds=int(os.getenv("STATION_CATALOG_FRESHNESS_SECONDS", str(7 * 24 * 60 * 60))),
         api_auth_enabled=_env_bool("API_AUTH_ENABLED", True),
         api_auth_username=os.getenv("API_AUTH_USERNAME", "analyst"),
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import csv
 import json
@@ -10,15 +11,57 @@ import unicodedata
 from datetime import datetime
 from io import StringIO
 from typing import Any
-from zoneinfo import ZoneInfo
 
 import httpx
 
+try:  # Optional speedup: parses UTF-8 payloads directly, ~2-3x faster than stdlib json.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when the extra is not installed
+    orjson = None  # type: ignore[assignment]
+
+try:  # Optional speedup: SIMD parser with lazy field materialization for row projection.
+    import simdjson
+except ImportError:  # pragma: no cover - exercised only when the extra is not installed
+    simdjson = None  # type: ignore[assignment]
+
 from app.core.exceptions import UpstreamServiceError
 from app.models import SourceMeasurement, StationCatalogItem
+from app.utils.dates import parse_iso_utc
 
 logger = logging.getLogger(__name__)
 
+_FLOAT_IN_TEXT_RE = re.compile(r"[-+]?\d+(?:[.,]\d+)?")
+
+
+def _to_float(value: Any) -> float | None:
+    """Coerce an AEMET field to float, short-circuiting the common cases.
+
+    Module-level so hot call sites skip the classmethod descriptor lookup,
+    with exact-type checks up front: AEMET rows are mostly floats, ints or
+    empty strings, and entering float()'s try/except for each of them costs
+    an exception-frame setup per call.
+    """
+    if value is None or value == "":
+        return None
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, str):
+        match = _FLOAT_IN_TEXT_RE.search(value)
+        if not match:
+            return None
+        try:
+            return float(match.group(0).replace(",", "."))
+        except ValueError:
+            return None
+    return None
+
 
 class AemetClient:
     BASE_URL = "https://opendata.aemet.es/opendata/api"
@@ -34,6 +77,23 @@ class AemetClient:
     _ROW_LATITUDE_KEYS = ("lat", "latitud", "latitude")
     _ROW_LONGITUDE_KEYS = ("lon", "long", "longitud", "longitude", "lng")
     _ROW_ALTITUDE_KEYS = ("alt", "altitud", "altitude")
+    # Inventory rows are normalized with lower() only, so these keep punctuation.
+    _INVENTORY_PROVINCE_KEYS = ("provincia", "provincia_nombre")
+    _INVENTORY_LATITUDE_KEYS = ("latitud", "lat", "latitude")
+    _INVENTORY_LONGITUDE_KEYS = ("longitud", "lon", "longitude")
+    _INVENTORY_ALTITUDE_KEYS = ("altitud", "alt", "altitude")
+    # Normalized keys _map_row actually consumes; everything else in a data row is discarded.
+    _PROJECTED_DATA_ROW_KEYS = frozenset(
+        _ROW_NAME_KEYS
+        + _ROW_DATETIME_KEYS
+        + _ROW_TEMPERATURE_KEYS
+        + _ROW_PRESSURE_KEYS
+        + _ROW_SPEED_KEYS
+        + _ROW_DIRECTION_KEYS
+        + _ROW_LATITUDE_KEYS
+        + _ROW_LONGITUDE_KEYS
+        + _ROW_ALTITUDE_KEYS
+    )
 
     def __init__(
         self,
@@ -47,12 +107,30 @@ class AemetClient:
         self.min_request_interval_seconds = max(0.0, min_request_interval_seconds)
         cap = retry_after_cap_seconds if retry_after_cap_seconds is not None else self.min_request_interval_seconds
         self.retry_after_cap_seconds = max(self.min_request_interval_seconds, cap)
-        self._http_client = httpx.Client(timeout=self.timeout_seconds)
+        # Keep-alive pooling avoids a fresh TCP+TLS handshake per station fetch;
+        # HTTP/2 additionally multiplexes concurrent fetches over one connection.
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        try:
+            self._http_client = httpx.Client(timeout=self.timeout_seconds, http2=True, limits=limits)
+        except ImportError:  # h2 extra not installed; HTTP/1.1 keep-alive still pools connections.
+            self._http_client = httpx.Client(timeout=self.timeout_seconds, limits=limits)
+        # One reusable parser per thread: simdjson reuses its internal buffer
+        # across parses but refuses concurrent reuse, and this client is
+        # called from threads (get_data_multi, the stale-window refresh pool).
+        self._json_parsers = threading.local()
+        # Single-flight bookkeeping: one in-flight task per (station, window) key.
+        self._inflight_fetches: dict[tuple[str, str, str], asyncio.Task] = {}
 
     def close(self) -> None:
         """Close the underlying HTTP connection pool."""
         self._http_client.close()
 
+    def __enter__(self) -> AemetClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def fetch_station_data(
         self,
         start_utc: datetime,
@@ -62,13 +140,119 @@ class AemetClient:
         if not self.api_key:
             raise UpstreamServiceError("AEMET_API_KEY environment variable is required")
 
-        endpoint = (
+        endpoint = self._station_data_endpoint(start_utc, end_utc, station_id)
+        logger.info("Requesting AEMET metadata URL for station %s", station_id)
+
+        raw_items = self._request_data_items(
+            endpoint,
+            allow_no_data=True,
+            no_data_log_context=f"station={station_id}",
+            project_row_keys=self._PROJECTED_DATA_ROW_KEYS,
+        )
+        mapped: list[SourceMeasurement] = []
+        for row in raw_items:
+            if not isinstance(row, dict):
+                continue
+            measurement = self._map_row(row)
+            if measurement is not None:
+                mapped.append(measurement)
+        return mapped
+
+    def _station_data_endpoint(self, start_utc: datetime, end_utc: datetime, station_id: str) -> str:
+        return (
             f"{self.BASE_URL}/antartida/datos/fechaini/{start_utc.strftime('%Y-%m-%dT%H:%M:%SUTC')}"
             f"/fechafin/{end_utc.strftime('%Y-%m-%dT%H:%M:%SUTC')}/estacion/{station_id}"
         )
-        logger.info("Requesting AEMET metadata URL for station %s", station_id)
 
-        raw_items = self._request_data_items(endpoint, allow_no_data=True, no_data_log_context=f"station={station_id}")
+    def _new_async_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(max_connections=32)
+        try:
+            return httpx.AsyncClient(timeout=self.timeout_seconds, http2=True, limits=limits)
+        except ImportError:  # h2 extra not installed; HTTP/1.1 keep-alive still pools connections.
+            return httpx.AsyncClient(timeout=self.timeout_seconds, limits=limits)
+
+    async def fetch_many_stations(
+        self,
+        start_utc: datetime,
+        end_utc: datetime,
+        station_ids: list[str],
+    ) -> dict[str, list[SourceMeasurement]]:
+        """Fetch the same window for several stations concurrently.
+
+        Station fetches are independent and I/O-bound, so issuing them through
+        one httpx.AsyncClient via asyncio.gather collapses N sequential round
+        trips into roughly one. Metadata requests still honour the shared
+        AEMET throttle; the presigned data downloads run fully in parallel.
+        """
+        if not self.api_key:
+            raise UpstreamServiceError("AEMET_API_KEY environment variable is required")
+
+        async with self._new_async_client() as client:
+            results = await asyncio.gather(
+                *[
+                    self._afetch_station_data(client, start_utc, end_utc, station_id)
+                    for station_id in station_ids
+                ]
+            )
+        return dict(zip(station_ids, results))
+
+    async def fetch_station_data_coalesced(
+        self,
+        start_utc: datetime,
+        end_utc: datetime,
+        station_id: str,
+    ) -> list[SourceMeasurement]:
+        """Fetch one station window with single-flight coalescing.
+
+        Concurrent callers asking for the same (station, window) while a fetch
+        is already in flight await that fetch instead of issuing a duplicate
+        AEMET request, which keeps the outbound request count (and quota burn)
+        at one per unique key no matter how many users hit the same station
+        near-simultaneously. The event loop serializes access to the in-flight
+        map, so no extra locking is needed.
+        """
+        if not self.api_key:
+            raise UpstreamServiceError("AEMET_API_KEY environment variable is required")
+
+        key = (station_id, start_utc.isoformat(), end_utc.isoformat())
+        task = self._inflight_fetches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_station_data_once(key, start_utc, end_utc, station_id))
+            self._inflight_fetches[key] = task
+        else:
+            logger.debug("Coalescing AEMET fetch for station %s window %s to %s", *key)
+        # Shield so one cancelled awaiter does not abort the fetch for the rest.
+        return await asyncio.shield(task)
+
+    async def _fetch_station_data_once(
+        self,
+        key: tuple[str, str, str],
+        start_utc: datetime,
+        end_utc: datetime,
+        station_id: str,
+    ) -> list[SourceMeasurement]:
+        try:
+            async with self._new_async_client() as client:
+                return await self._afetch_station_data(client, start_utc, end_utc, station_id)
+        finally:
+            self._inflight_fetches.pop(key, None)
+
+    async def _afetch_station_data(
+        self,
+        client: httpx.AsyncClient,
+        start_utc: datetime,
+        end_utc: datetime,
+        station_id: str,
+    ) -> list[SourceMeasurement]:
+        endpoint = self._station_data_endpoint(start_utc, end_utc, station_id)
+        logger.info("Requesting AEMET metadata URL for station %s", station_id)
+        raw_items = await self._arequest_data_items(
+            client,
+            endpoint,
+            allow_no_data=True,
+            no_data_log_context=f"station={station_id}",
+            project_row_keys=self._PROJECTED_DATA_ROW_KEYS,
+        )
         mapped: list[SourceMeasurement] = []
         for row in raw_items:
             if not isinstance(row, dict):
@@ -78,6 +262,33 @@ class AemetClient:
                 mapped.append(measurement)
         return mapped
 
+    async def _arequest_data_items(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        allow_no_data: bool,
+        no_data_log_context: str | None = None,
+        project_row_keys: frozenset[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        meta_response = await self._athrottled_get(client, endpoint, params={"api_key": self.api_key})
+        data_url = self._parse_metadata_response(
+            meta_response,
+            allow_no_data=allow_no_data,
+            no_data_log_context=no_data_log_context,
+        )
+        if data_url is None:
+            return []
+
+        # Presigned data URLs are not rate-limited by AEMET — skip throttle entirely.
+        logger.info("Downloading AEMET data from temporary URL")
+        try:
+            data_response = await client.get(data_url)
+        except httpx.RequestError as exc:
+            raise UpstreamServiceError(
+                f"AEMET data download failed for URL {data_url}: {exc.__class__.__name__}"
+            ) from exc
+        return self._parse_data_response(data_response, project_row_keys)
+
     def fetch_station_inventory(self) -> list[StationCatalogItem]:
         if not self.api_key:
             raise UpstreamServiceError("AEMET_API_KEY environment variable is required")
@@ -101,16 +312,18 @@ class AemetClient:
                 StationCatalogItem(
                     stationId=station_id,
                     stationName=station_name,
-                    province=self._normalize_province_code(normalized.get("provincia") or normalized.get("provincia_nombre")),
+                    province=self._normalize_province_code(
+                        self._first_non_empty(normalized, self._INVENTORY_PROVINCE_KEYS)
+                    ),
                     latitude=self._to_coordinate(
-                        normalized.get("latitud") or normalized.get("lat") or normalized.get("latitude"),
+                        self._first_non_empty(normalized, self._INVENTORY_LATITUDE_KEYS),
                         is_longitude=False,
                     ),
                     longitude=self._to_coordinate(
-                        normalized.get("longitud") or normalized.get("lon") or normalized.get("longitude"),
+                        self._first_non_empty(normalized, self._INVENTORY_LONGITUDE_KEYS),
                         is_longitude=True,
                     ),
-                    altitude=self._to_float(normalized.get("altitud") or normalized.get("alt") or normalized.get("altitude")),
+                    altitude=_to_float(self._first_non_empty(normalized, self._INVENTORY_ALTITUDE_KEYS)),
                 )
             )
         if stations:
@@ -190,9 +403,39 @@ class AemetClient:
         endpoint: str,
         allow_no_data: bool,
         no_data_log_context: str | None = None,
+        project_row_keys: frozenset[str] | None = None,
     ) -> list[dict[str, Any]]:
         client = self._http_client
         meta_response = self._throttled_get(client, endpoint, params={"api_key": self.api_key})
+        data_url = self._parse_metadata_response(
+            meta_response,
+            allow_no_data=allow_no_data,
+            no_data_log_context=no_data_log_context,
+        )
+        if data_url is None:
+            return []
+
+        # Presigned data URLs are not rate-limited by AEMET — skip throttle entirely.
+        logger.info("Downloading AEMET data from temporary URL")
+        try:
+            data_response = client.get(data_url)
+        except httpx.RequestError as exc:
+            raise UpstreamServiceError(
+                f"AEMET data download failed for URL {data_url}: {exc.__class__.__name__}"
+            ) from exc
+        return self._parse_data_response(data_response, project_row_keys)
+
+    def _parse_metadata_response(
+        self,
+        meta_response: httpx.Response,
+        allow_no_data: bool,
+        no_data_log_context: str | None,
+    ) -> str | None:
+        """Validate a metadata response and return its presigned data URL.
+
+        Returns None for the documented AEMET "no data" 404 shape when the
+        caller tolerates empty windows.
+        """
         try:
             meta_response.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -204,7 +447,7 @@ class AemetClient:
             raise UpstreamServiceError(detail) from exc
 
         try:
-            payload = meta_response.json()
+            payload = self._decode_json(meta_response)
         except ValueError as exc:
             raise UpstreamServiceError("AEMET metadata response is not valid JSON") from exc
 
@@ -218,22 +461,20 @@ class AemetClient:
             if allow_no_data and str(estado) == "404" and isinstance(descripcion, str) and "no hay datos" in descripcion.lower():
                 context = f" ({no_data_log_context})" if no_data_log_context else ""
                 logger.info("AEMET returned no data for requested criteria%s", context)
-                return []
+                return None
             detail_parts = ["AEMET response missing 'datos' URL"]
             if estado is not None:
                 detail_parts.append(f"estado={estado}")
             if descripcion:
                 detail_parts.append(f"descripcion={descripcion}")
             raise UpstreamServiceError(".".join(detail_parts))
+        return str(data_url)
 
-        # Presigned data URLs are not rate-limited by AEMET — skip throttle entirely.
-        logger.info("Downloading AEMET data from temporary URL")
-        try:
-            data_response = client.get(data_url)
-        except httpx.RequestError as exc:
-            raise UpstreamServiceError(
-                f"AEMET data download failed for URL {data_url}: {exc.__class__.__name__}"
-            ) from exc
+    def _parse_data_response(
+        self,
+        data_response: httpx.Response,
+        project_row_keys: frozenset[str] | None = None,
+    ) -> list[dict[str, Any]]:
         try:
             data_response.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -244,8 +485,13 @@ class AemetClient:
                 detail = f"{detail}. Retry-After={int(retry_after)}s"
             raise UpstreamServiceError(detail) from exc
 
+        if project_row_keys is not None:
+            projected = self._parse_projected_rows(data_response, project_row_keys)
+            if projected is not None:
+                return projected
+
         try:
-            raw_items = data_response.json()
+            raw_items = self._decode_json(data_response)
         except ValueError as exc:
             json_rows = self._parse_json_rows(data_response.text)
             if json_rows is not None:
@@ -276,13 +522,12 @@ class AemetClient:
 
         return raw_items
 
-    def _throttled_get(
-        self,
-        client: httpx.Client,
-        url: str,
-        **kwargs: Any,
-    ) -> httpx.Response:
-        # Compute required wait under lock, then release lock before sleeping.
+    def _reserve_request_slot(self) -> float:
+        """Reserve the next throttle slot and return how long to wait for it.
+
+        The wait must happen outside the lock so concurrent callers queue up
+        behind distinct slots instead of serializing on the lock itself.
+        """
         with self.__class__._request_lock:
             now = time.monotonic()
             elapsed_since_last = now - self.__class__._last_request_monotonic
@@ -291,20 +536,13 @@ class AemetClient:
             wait_for = max(wait_for_min_interval, wait_for_rate_limit, 0.0)
             # Reserve our slot by advancing the timestamp optimistically.
             self.__class__._last_request_monotonic = now + wait_for
+        return wait_for
 
-        if wait_for > 0:
-            logger.debug("Throttling AEMET request for %.2fs before GET %s", wait_for, url)
-            time.sleep(wait_for)
-
-        try:
-            response = client.get(url, **kwargs)
-        except httpx.RequestError as exc:
-            with self.__class__._request_lock:
-                self.__class__._last_request_monotonic = time.monotonic()
-            raise UpstreamServiceError(
-                f"AEMET request failed for URL {url}: {exc.__class__.__name__}"
-            ) from exc
+    def _record_request_failure(self) -> None:
+        with self.__class__._request_lock:
+            self.__class__._last_request_monotonic = time.monotonic()
 
+    def _record_request_completed(self, response: httpx.Response, url: str) -> None:
         completed_at = time.monotonic()
         with self.__class__._request_lock:
             self.__class__._last_request_monotonic = completed_at
@@ -318,8 +556,127 @@ class AemetClient:
                     retry_after,
                     url,
                 )
+
+    def _throttled_get(
+        self,
+        client: httpx.Client,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        wait_for = self._reserve_request_slot()
+        if wait_for > 0:
+            logger.debug("Throttling AEMET request for %.2fs before GET %s", wait_for, url)
+            time.sleep(wait_for)
+
+        try:
+            response = client.get(url, **kwargs)
+        except httpx.RequestError as exc:
+            self._record_request_failure()
+            raise UpstreamServiceError(
+                f"AEMET request failed for URL {url}: {exc.__class__.__name__}"
+            ) from exc
+
+        self._record_request_completed(response, url)
         return response
 
+    async def _athrottled_get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        wait_for = self._reserve_request_slot()
+        if wait_for > 0:
+            logger.debug("Throttling AEMET request for %.2fs before GET %s", wait_for, url)
+            await asyncio.sleep(wait_for)
+
+        try:
+            response = await client.get(url, **kwargs)
+        except httpx.RequestError as exc:
+            self._record_request_failure()
+            raise UpstreamServiceError(
+                f"AEMET request failed for URL {url}: {exc.__class__.__name__}"
+            ) from exc
+
+        self._record_request_completed(response, url)
+        return response
+
+    def _thread_json_parser(self):
+        """Return this thread's simdjson parser, creating it lazily.
+
+        simdjson.Parser raises when re-entered while proxies from a previous
+        parse are alive, so threads must never share one instance.
+        """
+        if simdjson is None:
+            return None
+        parser = getattr(self._json_parsers, "parser", None)
+        if parser is None:
+            parser = simdjson.Parser()
+            self._json_parsers.parser = parser
+        return parser
+
+    def _parse_projected_rows(
+        self,
+        response: httpx.Response,
+        project_row_keys: frozenset[str],
+    ) -> list[dict[str, Any]] | None:
+        """Parse a data payload with simdjson, materializing only the projected keys.
+
+        AEMET data rows carry many fields we never read (mes, ubi, nieve, ...).
+        simdjson keeps values on its internal tape until accessed, so restricting
+        access to the keys _map_row consumes avoids building throwaway Python
+        objects for the rest of each row. Iterating an object's keys is cheap;
+        only matching values are converted. Returns None whenever the payload is
+        not a plain array of objects so callers fall back to the generic decode
+        path (simdjson is also notoriously slow to iterate deeply, so we convert
+        kept rows to plain dicts immediately).
+        """
+        parser = self._thread_json_parser()
+        if parser is None:
+            return None
+        content = getattr(response, "content", None)
+        if not isinstance(content, (bytes, bytearray)):
+            return None
+        try:
+            doc = parser.parse(bytes(content))
+        except ValueError:
+            return None
+        except RuntimeError:
+            # Parser still referenced by proxies from an earlier parse on this
+            # thread; fall back to the generic decode path rather than fail.
+            return None
+        if not isinstance(doc, simdjson.Array):
+            return None
+        rows: list[dict[str, Any]] = []
+        normalized_key = self._normalized_key
+        for item in doc:
+            if not isinstance(item, simdjson.Object):
+                continue
+            row: dict[str, Any] = {}
+            for key in item.keys():
+                canonical = normalized_key(str(key))
+                if canonical in project_row_keys:
+                    row[canonical] = item[key]
+            if row:
+                rows.append(row)
+        return rows
+
+    @staticmethod
+    def _decode_json(response: httpx.Response) -> Any:
+        """Decode a JSON response body, preferring orjson on the raw bytes.
+
+        orjson parses the UTF-8 payload directly and skips the intermediate
+        text decode the stdlib path performs, which matters on the multi-MB
+        AEMET data downloads. Falls back to ``response.json()`` when orjson
+        is not installed or the response does not expose raw content.
+        orjson.JSONDecodeError subclasses ValueError, so callers can keep
+        catching ValueError either way.
+        """
+        content = getattr(response, "content", None)
+        if orjson is not None and isinstance(content, (bytes, bytearray)):
+            return orjson.loads(content)
+        return response.json()
+
     def _retry_after_seconds(self, response: httpx.Response) -> float:
         raw = response.headers.get("Retry-After")
         if raw is None:
@@ -454,23 +811,7 @@ class AemetClient:
                         return round(decimal, 6)
         return cls._to_float(value)
 
-    @staticmethod
-    def _to_float(value: Any) -> float | None:
-        if value in (None, ""):
-            return None
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            pass
-        if isinstance(value, str):
-            match = re.search(r"[-+]?\d+(?:[.,]\d+)?", value)
-            if not match:
-                return None
-            try:
-                return float(match.group(0).replace(",", "."))
-            except ValueError:
-                return None
-        return None
+    _to_float = staticmethod(_to_float)
 
     @staticmethod
     def _normalized_key(key: str) -> str:
@@ -499,14 +840,7 @@ class AemetClient:
         raw = str(value).strip()
         if not raw:
             return None
-        normalized = raw.replace("Z", "+00:00")
-        try:
-            parsed = datetime.fromisoformat(normalized)
-        except ValueError:
-            return None
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=ZoneInfo("UTC"))
-        return parsed.astimezone(ZoneInfo("UTC"))
+        return parse_iso_utc(raw)
 
     @classmethod
     def _to_direction_deg(cls, value: Any) -> float | None:
@@ -558,11 +892,11 @@ class AemetClient:
         return SourceMeasurement(
             station_name=station_name,
             measured_at_utc=measured_at_utc,
-            temperature_c=cls._to_float(cls._first_non_empty(normalized, cls._ROW_TEMPERATURE_KEYS)),
-            pressure_hpa=cls._to_float(cls._first_non_empty(normalized, cls._ROW_PRESSURE_KEYS)),
-            speed_mps=cls._to_float(cls._first_non_empty(normalized, cls._ROW_SPEED_KEYS)),
+            temperature_c=_to_float(cls._first_non_empty(normalized, cls._ROW_TEMPERATURE_KEYS)),
+            pressure_hpa=_to_float(cls._first_non_empty(normalized, cls._ROW_PRESSURE_KEYS)),
+            speed_mps=_to_float(cls._first_non_empty(normalized, cls._ROW_SPEED_KEYS)),
             direction_deg=cls._to_direction_deg(cls._first_non_empty(normalized, cls._ROW_DIRECTION_KEYS)),
             latitude=cls._to_coordinate(cls._first_non_empty(normalized, cls._ROW_LATITUDE_KEYS), is_longitude=False),
             longitude=cls._to_coordinate(cls._first_non_empty(normalized, cls._ROW_LONGITUDE_KEYS), is_longitude=True),
-            altitude_m=cls._to_float(cls._first_non_empty(normalized, cls._ROW_ALTITUDE_KEYS)),
+            altitude_m=_to_float(cls._first_non_empty(normalized, cls._ROW_ALTITUDE_KEYS)),
         )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from datetime import datetime, timedelta, tzinfo
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, tzinfo
+from math import atan2, degrees
+
+import numpy as np
 
 from app.models import (
     LatestAvailabilityResponse,
@@ -13,12 +16,64 @@ from app.models import (
     TimeAggregation,
 )
 from app.services.antarctic.constants import MADRID_TZ, STATION_LOCAL_TZ, UTC
-from app.services.antarctic.math_utils import avg, avg_angle_deg
+from app.services.antarctic.math_utils import _DEG_TO_RAD
 from app.services.antarctic.windows import next_month_start, previous_month_start, split_month_windows_covering_range, start_of_month
+from app.services.measurement_batch import MeasurementBatch
 
 logger = logging.getLogger(__name__)
 
 
+def _to_utc(value: datetime) -> datetime:
+    """Convert to UTC, skipping the tz arithmetic when already there.
+
+    Request datetimes usually arrive from Pydantic carrying timezone.utc, for
+    which astimezone would still walk the zoneinfo machinery; an identity
+    check covers that common case.
+    """
+    if value.tzinfo is UTC or value.tzinfo is timezone.utc:
+        return value
+    return value.astimezone(UTC)
+
+
+def _utc_offset_table(tz: tzinfo, start_epoch: int, end_epoch: int) -> tuple[np.ndarray, np.ndarray]:
+    """Enumerate the tz offsets covering [start_epoch, end_epoch].
+
+    Returns parallel arrays of transition epochs (the first entry is the
+    window start) and offset seconds, suitable for np.searchsorted lookup.
+    Offsets are probed once per day and each detected change is bisected to
+    the exact second, so building the table costs O(days + transitions)
+    zoneinfo lookups instead of one per row.
+    """
+    from_timestamp = datetime.fromtimestamp
+
+    def offset_at(epoch: int) -> int:
+        return int(from_timestamp(epoch, tz=UTC).astimezone(tz).utcoffset().total_seconds())
+
+    transitions = [start_epoch]
+    offsets = [offset_at(start_epoch)]
+    day = 86400
+    probe = start_epoch - (start_epoch % day) + day
+    previous_epoch = start_epoch
+    previous_offset = offsets[0]
+    while previous_epoch < end_epoch:
+        point = min(probe, end_epoch)
+        current = offset_at(point)
+        if current != previous_offset:
+            low, high = previous_epoch, point
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset_at(middle) == previous_offset:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append(high)
+            offsets.append(current)
+            previous_offset = current
+        previous_epoch = point
+        probe += day
+    return np.asarray(transitions, dtype=np.int64), np.asarray(offsets, dtype=np.int64)
+
+
 class DataMixin:
     repository: object
     aemet_client: object
@@ -35,8 +90,8 @@ class DataMixin:
     ) -> list[OutputMeasurement]:
         station_id = self.station_id_for(station)
         self._assert_station_supported_by_antarctic_endpoint(station_id)
-        start_utc = start_local.astimezone(UTC)
-        end_utc = end_local.astimezone(UTC)
+        start_utc = _to_utc(start_local)
+        end_utc = _to_utc(end_local)
         if start_utc >= end_utc:
             raise ValueError("Start datetime must be before end datetime")
 
@@ -47,6 +102,7 @@ class DataMixin:
                 start_utc=window_start_utc,
                 end_utc=window_end_utc,
             )
+            should_refresh_direction = False
             if has_cached_window:
                 should_refresh_direction = self._needs_direction_recovery_refresh(
                     station_id=station_id,
@@ -72,27 +128,86 @@ class DataMixin:
                         window_start_utc.isoformat(),
                         window_end_utc.isoformat(),
                     )
+                    self._maybe_schedule_stale_refresh(station_id, window_start_utc, window_end_utc)
                     continue
 
-            logger.info(
-                "Cache miss for station %s; fetching window %s/%s from AEMET (%s to %s)",
-                station_id,
-                index,
-                len(upstream_windows),
-                window_start_utc.isoformat(),
-                window_end_utc.isoformat(),
-            )
-            remote_rows = self.aemet_client.fetch_station_data(window_start_utc, window_end_utc, station_id)
-            self.repository.upsert_measurements(
-                station_id=station_id,
-                rows=remote_rows,
-                start_utc=window_start_utc,
-                end_utc=window_end_utc,
-            )
+            # A miss may still be partially covered by earlier, narrower
+            # fetches; repositories that can compute the interval difference
+            # let us fetch only the gaps instead of the whole window. A
+            # direction-recovery refresh must bypass that: its window is
+            # already fully covered, so the interval difference would report
+            # no gaps and the re-fetch would never happen.
+            missing_intervals = getattr(self.repository, "get_missing_intervals", None)
+            if should_refresh_direction or not callable(missing_intervals):
+                gaps = [(window_start_utc, window_end_utc)]
+            else:
+                gaps = missing_intervals(station_id, window_start_utc, window_end_utc)
+            for gap_start_utc, gap_end_utc in gaps:
+                logger.info(
+                    "Cache miss for station %s; fetching gap of window %s/%s from AEMET (%s to %s)",
+                    station_id,
+                    index,
+                    len(upstream_windows),
+                    gap_start_utc.isoformat(),
+                    gap_end_utc.isoformat(),
+                )
+                remote_rows = self.aemet_client.fetch_station_data(gap_start_utc, gap_end_utc, station_id)
+                self.repository.upsert_measurements(
+                    station_id=station_id,
+                    rows=remote_rows,
+                    start_utc=gap_start_utc,
+                    end_utc=gap_end_utc,
+                )
 
-        rows = self.repository.get_measurements(station_id, start_utc, end_utc)
-        transformed = self._aggregate(rows, aggregation)
-        return [self._to_output(row, selected_types, output_tz=output_tz) for row in transformed]
+        cache_key = self._aggregated_cache_key(
+            station_id, start_utc, end_utc, aggregation, selected_types, output_tz
+        )
+        if cache_key is not None:
+            cached = self._aggregated_cache_get(cache_key)
+            if cached is not None:
+                return list(cached)
+
+        batch = self._read_measurements_batch(station_id, start_utc, end_utc)
+        transformed = self._aggregate(batch, aggregation)
+        local_datetimes = self._local_datetimes(transformed, output_tz)
+        include_flags = self._include_flags(selected_types)
+        output = [
+            self._to_output(row, local_dt, include_flags)
+            for row, local_dt in zip(transformed, local_datetimes)
+        ]
+        if cache_key is not None:
+            self._aggregated_cache_put(cache_key, output)
+        return output
+
+    def get_data_multi(
+        self,
+        stations: list[str | Station],
+        start_local: datetime,
+        end_local: datetime,
+        aggregation: TimeAggregation,
+        selected_types: list[MeasurementType],
+        output_tz: tzinfo = MADRID_TZ,
+    ) -> dict[str, list[OutputMeasurement]]:
+        """Run get_data for several stations concurrently.
+
+        Each station's work is dominated by AEMET HTTP calls and SQLite I/O,
+        so running them on threads brings the wall time close to the slowest
+        station instead of the sum. The repository keeps per-thread
+        connections, which makes the parallel calls safe. Results are keyed
+        by station label; any per-station failure propagates unchanged.
+        """
+        labels = [station.value if isinstance(station, Station) else station for station in stations]
+        if len(stations) <= 1:
+            return {
+                label: self.get_data(station, start_local, end_local, aggregation, selected_types, output_tz)
+                for label, station in zip(labels, stations)
+            }
+        with ThreadPoolExecutor(max_workers=len(stations), thread_name_prefix="station-fetch") as pool:
+            futures = [
+                pool.submit(self.get_data, station, start_local, end_local, aggregation, selected_types, output_tz)
+                for station in stations
+            ]
+            return {label: future.result() for label, future in zip(labels, futures)}
 
     def refresh_data_range(
         self,
@@ -102,8 +217,8 @@ class DataMixin:
     ) -> None:
         station_id = self.station_id_for(station)
         self._assert_station_supported_by_antarctic_endpoint(station_id)
-        start_utc = start_local.astimezone(UTC)
-        end_utc = end_local.astimezone(UTC)
+        start_utc = _to_utc(start_local)
+        end_utc = _to_utc(end_local)
         if start_utc >= end_utc:
             raise ValueError("Start datetime must be before end datetime")
 
@@ -125,6 +240,62 @@ class DataMixin:
                 end_utc=window_end_utc,
             )
 
+    def _maybe_schedule_stale_refresh(self, station_id: str, start_utc: datetime, end_utc: datetime) -> None:
+        """Re-fetch a stale cached window in the background.
+
+        The caller still serves the cached rows immediately; only windows
+        whose last fetch falls between the freshness and stale deltas are
+        refreshed, so anything older keeps the long-standing serve-from-cache
+        behaviour and anything fresh costs one repository probe. Windows are
+        deduplicated so repeated requests do not pile up fetches.
+        """
+        pool = getattr(self, "_refresh_pool", None)
+        has_fresh = getattr(self.repository, "has_fresh_fetch_window", None)
+        fresh_delta = getattr(self, "cache_freshness_delta", None)
+        stale_delta = getattr(self, "cache_stale_delta", None)
+        if pool is None or not callable(has_fresh) or fresh_delta is None or stale_delta is None:
+            return
+        now_utc = datetime.now(UTC)
+        if has_fresh(station_id, start_utc, end_utc, now_utc - fresh_delta):
+            return
+        if not has_fresh(station_id, start_utc, end_utc, now_utc - fresh_delta - stale_delta):
+            return
+
+        key = (station_id, start_utc.isoformat(), end_utc.isoformat())
+        lock = self._refresh_lock
+        with lock:
+            if key in self._inflight_refreshes:
+                return
+            self._inflight_refreshes.add(key)
+
+        def _refresh() -> None:
+            try:
+                logger.info(
+                    "Background refresh of stale window for station %s (%s to %s)",
+                    station_id,
+                    start_utc.isoformat(),
+                    end_utc.isoformat(),
+                )
+                remote_rows = self.aemet_client.fetch_station_data(start_utc, end_utc, station_id)
+                self.repository.upsert_measurements(
+                    station_id=station_id,
+                    rows=remote_rows,
+                    start_utc=start_utc,
+                    end_utc=end_utc,
+                )
+            except Exception:
+                logger.exception(
+                    "Background refresh failed for station %s window %s to %s",
+                    station_id,
+                    start_utc.isoformat(),
+                    end_utc.isoformat(),
+                )
+            finally:
+                with lock:
+                    self._inflight_refreshes.discard(key)
+
+        pool.submit(_refresh)
+
     def _needs_direction_recovery_refresh(
         self,
         station_id: str,
@@ -250,38 +421,235 @@ class DataMixin:
             note=f"No observations were found in the last {self._LATEST_AVAILABILITY_MAX_LOOKBACK_DAYS} days for this station.",
         )
 
-    def _aggregate(self, rows: list[SourceMeasurement], aggregation: TimeAggregation) -> list[SourceMeasurement]:
-        if aggregation == TimeAggregation.NONE:
-            return rows
-
-        grouped: dict[datetime, list[SourceMeasurement]] = defaultdict(list)
-        for row in rows:
-            local_dt = row.measured_at_utc.astimezone(STATION_LOCAL_TZ)
-            if aggregation == TimeAggregation.HOURLY:
-                key = local_dt.replace(minute=0, second=0, microsecond=0)
-            elif aggregation == TimeAggregation.DAILY:
-                key = local_dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            else:
-                key = local_dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            grouped[key].append(row)
+    def _read_measurements_batch(
+        self,
+        station_id: str,
+        start_utc: datetime,
+        end_utc: datetime,
+    ) -> MeasurementBatch:
+        """Load a window as columnar arrays, preferring the repository's
+        direct batch reader and packing model rows only for repositories
+        (fakes included) that lack one.
+
+        The service keeps the most recent batch per station, stamped with the
+        repository's data version; a request for a sub-window of that batch
+        at the same version is answered by binary-search slicing instead of
+        another repository read. slice_window's inclusive bounds match the
+        SQL range predicate, so the sliced view equals a fresh read.
+        """
+        version_of = getattr(self.repository, "get_data_version", None)
+        cache = getattr(self, "_batch_cache", None)
+        version = version_of(station_id) if callable(version_of) else None
+        start_epoch = int(start_utc.timestamp())
+        end_epoch = int(end_utc.timestamp())
+        if cache is not None and version is not None:
+            with self._batch_cache_lock:
+                entry = cache.get(station_id)
+            if entry is not None:
+                cached_version, cached_start, cached_end, cached_batch = entry
+                if cached_version == version and cached_start <= start_epoch and end_epoch <= cached_end:
+                    return cached_batch.slice_window(start_utc, end_utc)
+
+        batch_reader = getattr(self.repository, "get_measurements_batch", None)
+        if callable(batch_reader):
+            batch = batch_reader(station_id, start_utc, end_utc)
+        else:
+            batch = MeasurementBatch.from_rows(self.repository.get_measurements(station_id, start_utc, end_utc))
+        if cache is not None and version is not None:
+            with self._batch_cache_lock:
+                cache[station_id] = (version, start_epoch, end_epoch, batch)
+        return batch
+
+    _AGGREGATED_CACHE_MAX = 256
+
+    def _aggregated_cache_key(
+        self,
+        station_id: str,
+        start_utc: datetime,
+        end_utc: datetime,
+        aggregation: TimeAggregation,
+        selected_types: list[MeasurementType],
+        output_tz: tzinfo,
+    ) -> tuple | None:
+        """Build the memoization key for a finished get_data call.
+
+        The repository's per-station data version is part of the key, so
+        every measurement write moves identical queries to a fresh entry and
+        stale results simply age out of the LRU. Repositories without a
+        version counter (the test fakes) get no caching at all, which keeps
+        their call-count assertions meaningful.
+        """
+        cache = getattr(self, "_aggregated_cache", None)
+        version_of = getattr(self.repository, "get_data_version", None)
+        if cache is None or not callable(version_of):
+            return None
+        return (
+            station_id,
+            version_of(station_id),
+            int(start_utc.timestamp()),
+            int(end_utc.timestamp()),
+            aggregation,
+            frozenset(selected_types),
+            str(output_tz),
+        )
+
+    def _aggregated_cache_get(self, cache_key: tuple) -> list[OutputMeasurement] | None:
+        with self._aggregated_cache_lock:
+            cached = self._aggregated_cache.get(cache_key)
+            if cached is not None:
+                self._aggregated_cache.move_to_end(cache_key)
+            return cached
+
+    def _aggregated_cache_put(self, cache_key: tuple, output: list[OutputMeasurement]) -> None:
+        with self._aggregated_cache_lock:
+            self._aggregated_cache[cache_key] = output
+            self._aggregated_cache.move_to_end(cache_key)
+            while len(self._aggregated_cache) > self._AGGREGATED_CACHE_MAX:
+                self._aggregated_cache.popitem(last=False)
+
+    def _aggregate(self, batch: MeasurementBatch, aggregation: TimeAggregation) -> list[SourceMeasurement]:
+        if aggregation == TimeAggregation.NONE or not len(batch):
+            return batch.to_rows()
+
+        # Struct-of-arrays aggregation: the batch already holds the value
+        # columns as contiguous NumPy arrays (NaN marking missing), so each
+        # bucket reduction runs as a vectorized np.add.reduceat over sorted
+        # keys with no per-row Python work.
+        count = len(batch)
+        epochs = batch.epochs
+        temperature = batch.temperature_c
+        pressure = batch.pressure_hpa
+        speed = batch.speed_mps
+        direction = batch.direction_deg
+
+        # The station tz offset is constant within a DST segment; probing it
+        # at the window edges covers the common case with two lookups instead
+        # of one binary search over the transition table per row.
+        from_timestamp = datetime.fromtimestamp
+        constant_offset = self._constant_utc_offset(
+            STATION_LOCAL_TZ,
+            from_timestamp(int(epochs[0]), tz=UTC),
+            from_timestamp(int(epochs[-1]), tz=UTC),
+        )
+        if constant_offset is not None:
+            local_seconds = epochs + int(constant_offset.total_seconds())
+        else:
+            # DST-straddling window: resolve the handful of offset segments
+            # once and assign each row's offset with a vectorized lookup.
+            transitions, segment_offsets = _utc_offset_table(
+                STATION_LOCAL_TZ, int(epochs.min()), int(epochs.max())
+            )
+            segment_indices = np.searchsorted(transitions, epochs, side="right") - 1
+            local_seconds = epochs + segment_offsets[segment_indices]
+
+        # Bucket keys are plain integers: seconds-based floor division for
+        # hourly/daily, months-since-epoch for monthly. The bucket's wall-clock
+        # start is recovered from the key only once per bucket further down.
+        if aggregation == TimeAggregation.HOURLY:
+            bucket_seconds = 3600
+            bucket_ids = local_seconds // bucket_seconds
+        elif aggregation == TimeAggregation.DAILY:
+            bucket_seconds = 86400
+            bucket_ids = local_seconds // bucket_seconds
+        else:
+            bucket_seconds = None
+            bucket_ids = local_seconds.astype("datetime64[s]").astype("datetime64[M]").view(np.int64)
+
+        order = np.argsort(bucket_ids, kind="stable")
+        starts = np.unique(bucket_ids[order], return_index=True)[1]
+
+        def reduce_mean(column: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            values = column[order]
+            valid = ~np.isnan(values)
+            sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+            counts = np.add.reduceat(valid.astype(np.int64), starts)
+            return sums, counts
+
+        t_sums, t_counts = reduce_mean(temperature)
+        p_sums, p_counts = reduce_mean(pressure)
+        s_sums, s_counts = reduce_mean(speed)
+
+        # Directions accumulate as complex64 unit vectors e^{i*theta}: one
+        # reduceat pass over one array instead of separate cos and sin
+        # columns, at half the bytes of two float64 buffers. Invalid samples
+        # become the zero vector so they drop out of the sums.
+        direction_sorted = direction[order]
+        direction_valid = ~np.isnan(direction_sorted)
+        radians = np.where(direction_valid, direction_sorted, 0.0).astype(np.float32)
+        radians *= np.float32(_DEG_TO_RAD)
+        unit_vectors = np.where(direction_valid, np.exp(1j * radians), np.complex64(0.0))
+        vector_sums = np.add.reduceat(unit_vectors, starts)
+        direction_counts = np.add.reduceat(direction_valid.astype(np.int64), starts)
 
         aggregated: list[SourceMeasurement] = []
-        for key, items in sorted(grouped.items(), key=lambda pair: pair[0]):
+        for index, bucket_start in enumerate(starts):
+            # Materialize the bucket boundary once per bucket: reinterpret the
+            # local wall-clock seconds in the station tz, then convert to UTC.
+            bucket_id = bucket_ids[order[bucket_start]]
+            if bucket_seconds is not None:
+                wall_seconds = int(bucket_id) * bucket_seconds
+            else:
+                wall_seconds = int(bucket_id.view("datetime64[M]").astype("datetime64[s]").view(np.int64))
+            local_key = datetime.fromtimestamp(wall_seconds, tz=UTC).replace(tzinfo=STATION_LOCAL_TZ)
+            if direction_counts[index]:
+                vector = vector_sums[index]
+                x = float(vector.real)
+                y = float(vector.imag)
+                direction_deg = round(degrees(atan2(y, x)) % 360.0, 3) if x != 0 or y != 0 else None
+            else:
+                direction_deg = None
+            # model_construct skips Pydantic validation; every value here is
+            # computed from already-validated rows, so the per-object
+            # validation pass would only re-check our own floats.
             aggregated.append(
-                SourceMeasurement(
-                    station_name=items[0].station_name,
-                    measured_at_utc=key.astimezone(UTC),
-                    temperature_c=avg([item.temperature_c for item in items]),
-                    pressure_hpa=avg([item.pressure_hpa for item in items]),
-                    speed_mps=avg([item.speed_mps for item in items]),
-                    direction_deg=avg_angle_deg([item.direction_deg for item in items]),
-                    latitude=items[0].latitude,
-                    longitude=items[0].longitude,
-                    altitude_m=items[0].altitude_m,
+                SourceMeasurement.model_construct(
+                    station_name=batch.station_name,
+                    measured_at_utc=local_key.astimezone(UTC),
+                    temperature_c=round(float(t_sums[index] / t_counts[index]), 3) if t_counts[index] else None,
+                    pressure_hpa=round(float(p_sums[index] / p_counts[index]), 3) if p_counts[index] else None,
+                    speed_mps=round(float(s_sums[index] / s_counts[index]), 3) if s_counts[index] else None,
+                    direction_deg=direction_deg,
+                    latitude=batch.latitude,
+                    longitude=batch.longitude,
+                    altitude_m=batch.altitude_m,
                 )
             )
         return aggregated
 
+    @staticmethod
+    def _constant_utc_offset(tz: tzinfo, first_utc: datetime, last_utc: datetime) -> timedelta | None:
+        """Return the tz offset if it provably holds for the whole window.
+
+        Zone offsets only change at DST transitions, which everywhere sit
+        months apart. When both window edges resolve to the same offset and
+        the span is shorter than any gap between consecutive transitions,
+        the window cannot contain a full DST round trip, so that one offset
+        covers every row. Returns None when a per-row conversion is needed.
+        """
+        if abs((last_utc - first_utc).days) >= 90:
+            return None
+        first_offset = first_utc.astimezone(tz).utcoffset()
+        if first_offset != last_utc.astimezone(tz).utcoffset():
+            return None
+        return first_offset
+
+    @staticmethod
+    def _local_datetimes(rows: list[SourceMeasurement], output_tz: tzinfo) -> list[datetime]:
+        """Convert every row's measured_at_utc to output_tz in one batch.
+
+        The per-row astimezone call does a binary search over the tz
+        transition table; with the offset resolved once for the whole window
+        the conversion degrades to a timedelta add per row.
+        """
+        if not rows:
+            return []
+        offset = DataMixin._constant_utc_offset(
+            output_tz, rows[0].measured_at_utc, rows[-1].measured_at_utc
+        )
+        if offset is not None:
+            return [(row.measured_at_utc + offset).replace(tzinfo=output_tz) for row in rows]
+        return [row.measured_at_utc.astimezone(output_tz) for row in rows]
+
     @staticmethod
     def _split_upstream_windows(
         start_utc: datetime,
@@ -291,27 +659,39 @@ class DataMixin:
         _ = max_days
         return split_month_windows_covering_range(start_utc, end_utc)
 
+    @staticmethod
+    def _include_flags(selected_types: list[MeasurementType]) -> tuple[bool, bool, bool, bool]:
+        """Resolve the per-type inclusion flags once for a whole response.
+
+        The membership tests are cheap individually but used to run once per
+        output row; the tuple is computed once in get_data and shared.
+        """
+        include_all = not selected_types
+        return (
+            include_all or MeasurementType.TEMPERATURE in selected_types,
+            include_all or MeasurementType.PRESSURE in selected_types,
+            include_all or MeasurementType.SPEED in selected_types,
+            include_all or MeasurementType.DIRECTION in selected_types,
+        )
+
     @staticmethod
     def _to_output(
         row: SourceMeasurement,
-        selected_types: list[MeasurementType],
-        output_tz: tzinfo,
+        local_dt: datetime,
+        include_flags: tuple[bool, bool, bool, bool],
     ) -> OutputMeasurement:
-        local_dt = row.measured_at_utc.astimezone(output_tz)
-        include_all = not selected_types
-        include_temperature = include_all or MeasurementType.TEMPERATURE in selected_types
-        include_pressure = include_all or MeasurementType.PRESSURE in selected_types
-        include_speed = include_all or MeasurementType.SPEED in selected_types
-        include_direction = include_all or MeasurementType.DIRECTION in selected_types
-
-        return OutputMeasurement(
-            stationName=row.station_name,
-            datetime=local_dt,
-            temperature=row.temperature_c if include_temperature else None,
-            pressure=row.pressure_hpa if include_pressure else None,
-            speed=row.speed_mps if include_speed else None,
-            direction=row.direction_deg if include_direction else None,
+        include_temperature, include_pressure, include_speed, include_direction = include_flags
+
+        # Constructed from trusted internal rows: model_construct (with field
+        # names, not aliases) bypasses validation and alias resolution.
+        return OutputMeasurement.model_construct(
+            station_name=row.station_name,
+            datetime_cet=local_dt,
+            temperature_c=row.temperature_c if include_temperature else None,
+            pressure_hpa=row.pressure_hpa if include_pressure else None,
+            speed_mps=row.speed_mps if include_speed else None,
+            direction_deg=row.direction_deg if include_direction else None,
             latitude=row.latitude,
             longitude=row.longitude,
-            altitude=row.altitude_m,
+            altitude_m=row.altitude_m,
         )
@@ -1,16 +1,137 @@
 from __future__ import annotations
 
 import calendar
+import math
 from datetime import datetime
-from math import atan2, ceil, cos, radians, sin
-from statistics import fmean
+from math import ceil
+
+import numpy as np
+
+try:  # pragma: no cover - exercised only when numba is installed
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
 
 from app.models import TimeAggregation
 
+_DEG_TO_RAD = math.pi / 180.0
+
+
+def _circular_mean_deg_py(arr: np.ndarray) -> float:
+    """Circular mean in degrees of an array with NaNs marking missing values.
+
+    Returns NaN when there are no valid samples or the vector components
+    cancel exactly (no meaningful mean direction).
+    """
+    x = 0.0
+    y = 0.0
+    valid = 0
+    for i in range(arr.size):
+        value = arr[i]
+        if math.isnan(value):
+            continue
+        rad = math.radians(value)
+        x += math.cos(rad)
+        y += math.sin(rad)
+        valid += 1
+    if valid == 0 or (x == 0.0 and y == 0.0):
+        return math.nan
+    return math.degrees(math.atan2(y, x)) % 360.0
+
+
+def _circular_mean_deg_np(arr: np.ndarray) -> float:
+    """NumPy variant of :func:`_circular_mean_deg_py` for when numba is absent.
+
+    One vectorized radians/cos/sin pass over the valid samples replaces the
+    per-sample math.cos/math.sin dispatch, so the no-numba path still avoids
+    interpreter-bound trig loops.
+    """
+    valid = arr[~np.isnan(arr)]
+    if valid.size == 0:
+        return math.nan
+    # The compress above already copied, so the degree-to-radian multiply can
+    # reuse that buffer instead of allocating another intermediate.
+    rad = np.multiply(valid, _DEG_TO_RAD, out=valid)
+    x = float(np.cos(rad).sum())
+    y = float(np.sin(rad).sum())
+    if x == 0.0 and y == 0.0:
+        return math.nan
+    return math.degrees(math.atan2(y, x)) % 360.0
+
+
+def _dominant_bin_index_py(arr: np.ndarray) -> int:
+    """Index of the most populated 22.5-degree bin, or -1 with no samples."""
+    bins = np.zeros(16, dtype=np.int64)
+    valid = 0
+    for i in range(arr.size):
+        value = arr[i]
+        if math.isnan(value):
+            continue
+        normalized = value % 360.0
+        bins[int(((normalized + 11.25) % 360.0) // 22.5)] += 1
+        valid += 1
+    if valid == 0:
+        return -1
+    best = 0
+    for index in range(1, 16):
+        if bins[index] > bins[best]:
+            best = index
+    return best
+
+
+def _dominant_bin_index_np(arr: np.ndarray) -> int:
+    """NumPy variant of :func:`_dominant_bin_index_py` for when numba is absent.
+
+    Bin indices for all valid samples come from one vectorized pass and
+    np.bincount builds the histogram in C. argmax returns the first of any
+    tied maxima, preserving the loop version's strict-greater tie-break.
+    """
+    valid = arr[~np.isnan(arr)]
+    if valid.size == 0:
+        return -1
+    bins = ((valid % 360.0 + 11.25) % 360.0) // 22.5
+    return int(np.bincount(bins.astype(np.int64), minlength=16).argmax())
+
+
+if njit is not None:
+    # JIT-compiled per-sample trig beats the generator-based sum() loops by
+    # roughly an order of magnitude; cache=True persists the compiled kernel
+    # so the compile cost is paid once per machine, not per process. fastmath
+    # is deliberately off: both kernels rely on NaN sentinels, which its
+    # no-NaN assumption would break.
+    _circular_mean_deg = njit(cache=True)(_circular_mean_deg_py)
+    _dominant_bin_index = njit(cache=True)(_dominant_bin_index_py)
+    # Warm both kernels at import so the first request never pays the
+    # compile (or cache-load) latency.
+    _warmup = np.array([0.0], dtype=np.float64)
+    _circular_mean_deg(_warmup)
+    _dominant_bin_index(_warmup)
+    del _warmup
+else:
+    _circular_mean_deg = _circular_mean_deg_np
+    _dominant_bin_index = _dominant_bin_index_np
+
+
+def _to_float_array(values: list[float | None]) -> np.ndarray:
+    return np.fromiter(
+        (value if value is not None else math.nan for value in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+
 
 def avg(values: list[float | None]) -> float | None:
-    real = [v for v in values if v is not None]
-    return round(fmean(real), 3) if real else None
+    # One fused pass: the old filter comprehension allocated an intermediate
+    # list that statistics.fmean then walked a second time. Typical groups
+    # here are a handful to a few hundred samples, where the plain loop also
+    # beats NumPy's per-call setup cost.
+    total = 0.0
+    count = 0
+    for value in values:
+        if value is not None:
+            total += value
+            count += 1
+    return round(total / count, 3) if count else None
 
 
 def percentile(values: list[float], p: float) -> float | None:
@@ -22,31 +143,21 @@ def percentile(values: list[float], p: float) -> float | None:
 
 
 def avg_angle_deg(values: list[float | None]) -> float | None:
-    angles = [v for v in values if v is not None]
-    if not angles:
+    if not values:
         return None
-    x = sum(cos(radians(a)) for a in angles)
-    y = sum(sin(radians(a)) for a in angles)
-    if x == 0 and y == 0:
+    result = _circular_mean_deg(_to_float_array(values))
+    if math.isnan(result):
         return None
-    angle = atan2(y, x)
-    return round((angle * 180.0 / 3.141592653589793) % 360, 3)
+    return round(result, 3)
 
 
 def dominant_angle_deg(values: list[float | None]) -> float | None:
-    angles = [v for v in values if v is not None]
-    if not angles:
+    if not values:
         return None
-    bins = [0] * 16
-    for value in angles:
-        normalized = value % 360.0
-        index = int(((normalized + 11.25) % 360) // 22.5)
-        bins[index] += 1
-    max_count = max(bins)
-    if max_count <= 0:
+    index = _dominant_bin_index(_to_float_array(values))
+    if index < 0:
         return None
-    dominant_index = bins.index(max_count)
-    return round((dominant_index * 22.5) % 360.0, 3)
+    return round((index * 22.5) % 360.0, 3)
 
 
 def wind_toward_direction_deg(direction_from_deg: float | None) -> float | None:
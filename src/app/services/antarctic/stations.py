@@ -12,18 +12,27 @@ class StationCatalogMixin:
     repository: object
 
     def station_id_for(self, station: str | Station) -> str:
-        if isinstance(station, Station):
-            return self.settings.gabriel_station_id if station == Station.GABRIEL_DE_CASTILLA else self.settings.juan_station_id
-        normalized = station.strip()
-        if normalized == Station.GABRIEL_DE_CASTILLA.value:
-            return self.settings.gabriel_station_id
-        if normalized == Station.JUAN_CARLOS_I.value:
-            return self.settings.juan_station_id
-        return normalized
+        # One dict lookup replaces the enum/string comparison chain; raw
+        # station ids fall through unchanged via the .get default.
+        mapping = getattr(self, "_station_ids", None)
+        if mapping is None:
+            mapping = {
+                Station.GABRIEL_DE_CASTILLA: self.settings.gabriel_station_id,
+                Station.JUAN_CARLOS_I: self.settings.juan_station_id,
+            }
+            self._station_ids = mapping
+        key = station if isinstance(station, Station) else station.strip()
+        return mapping.get(key, key)
+
+    def _catalog_freshness_delta(self) -> timedelta:
+        cached = getattr(self, "station_catalog_freshness_delta", None)
+        if cached is not None:
+            return cached
+        return timedelta(seconds=self.settings.station_catalog_freshness_seconds)
 
     def get_station_catalog(self, force_refresh: bool = False, antarctic_only: bool = True) -> StationCatalogResponse:
         checked_at_utc = datetime.now(UTC)
-        min_fetched_at_utc = checked_at_utc - timedelta(seconds=self.settings.station_catalog_freshness_seconds)
+        min_fetched_at_utc = checked_at_utc - self._catalog_freshness_delta()
         cache_hit = (not force_refresh) and self.repository.has_fresh_station_catalog(min_fetched_at_utc)
 
         if cache_hit:
@@ -42,7 +51,7 @@ class StationCatalogMixin:
         effective_fetched_at = last_fetched_at or checked_at_utc
         return StationCatalogResponse(
             checked_at_utc=checked_at_utc,
-            cached_until_utc=effective_fetched_at + timedelta(seconds=self.settings.station_catalog_freshness_seconds),
+            cached_until_utc=effective_fetched_at + self._catalog_freshness_delta(),
             cache_hit=cache_hit,
             data=rows,
         )
@@ -1,6 +1,13 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 from app.core.config import Settings
+from app.models import Station
 from app.services.aemet_client import AemetClient
 from app.services.antarctic import AnalysisMixin, DataMixin, PlaybackAnalyticsMixin, StationCatalogMixin
+from app.services.measurement_batch import MeasurementBatch
 from app.services.repository import SQLiteRepository
 
 
@@ -9,3 +16,31 @@ class AntarcticService(StationCatalogMixin, DataMixin, AnalysisMixin, PlaybackAn
         self.settings = settings
         self.repository = repository
         self.aemet_client = aemet_client
+        # Settings are immutable for the process lifetime, so the derived
+        # freshness delta is built once instead of per request.
+        self.station_catalog_freshness_delta = timedelta(seconds=settings.station_catalog_freshness_seconds)
+        self.cache_freshness_delta = timedelta(seconds=settings.cache_freshness_seconds)
+        self.cache_stale_delta = timedelta(seconds=settings.cache_stale_seconds)
+        # Stale-while-revalidate: cached windows that have outlived the
+        # freshness delta (but not the stale delta) are served immediately
+        # while this pool re-fetches them. The service is process-wide (see
+        # api.dependencies), so the pool and in-flight bookkeeping are too.
+        self._refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="window-refresh")
+        self._refresh_lock = threading.Lock()
+        self._inflight_refreshes: set[tuple[str, str, str]] = set()
+        # LRU of finished get_data outputs, keyed on the query parameters plus
+        # the repository's per-station data version so any write invalidates
+        # naturally (see DataMixin._aggregated_cache_key).
+        self._aggregated_cache: OrderedDict[tuple, list] = OrderedDict()
+        self._aggregated_cache_lock = threading.Lock()
+        # Most recent measurement batch per station, version-stamped like the
+        # aggregated cache; sub-window reads are served by slicing it (see
+        # DataMixin._read_measurements_batch).
+        self._batch_cache: dict[str, tuple[int, int, int, MeasurementBatch]] = {}
+        self._batch_cache_lock = threading.Lock()
+        # Station is a str enum, so these entries also resolve the plain
+        # station-name strings used by the API layer.
+        self._station_ids = {
+            Station.GABRIEL_DE_CASTILLA: settings.gabriel_station_id,
+            Station.JUAN_CARLOS_I: settings.juan_station_id,
+        }
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.models import SourceMeasurement
+
+_NAN = float("nan")
+
+
+@dataclass
+class MeasurementBatch:
+    """Struct-of-arrays form of one station's measurement window.
+
+    Internal transfer type between the repository and the aggregation path:
+    the value columns live in contiguous float64 arrays with NaN marking
+    missing values, and the station-constant metadata (name, coordinates)
+    is stored once instead of on every row. Pydantic models are only
+    materialized at the serialization boundary, so a cached window of
+    thousands of samples costs five arrays instead of thousands of objects.
+    """
+
+    station_name: str
+    epochs: np.ndarray
+    temperature_c: np.ndarray
+    pressure_hpa: np.ndarray
+    speed_mps: np.ndarray
+    direction_deg: np.ndarray
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude_m: float | None = None
+
+    def __len__(self) -> int:
+        return int(self.epochs.size)
+
+    @classmethod
+    def empty(cls) -> MeasurementBatch:
+        return cls(
+            station_name="",
+            epochs=np.empty(0, dtype=np.int64),
+            temperature_c=np.empty(0, dtype=np.float64),
+            pressure_hpa=np.empty(0, dtype=np.float64),
+            speed_mps=np.empty(0, dtype=np.float64),
+            direction_deg=np.empty(0, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: list[SourceMeasurement]) -> MeasurementBatch:
+        """Pack model rows into columns, assuming one station per batch."""
+        if not rows:
+            return cls.empty()
+        count = len(rows)
+        first = rows[0]
+        return cls(
+            station_name=first.station_name,
+            epochs=np.fromiter((row.measured_at_utc.timestamp() for row in rows), dtype=np.int64, count=count),
+            temperature_c=np.fromiter(
+                (row.temperature_c if row.temperature_c is not None else _NAN for row in rows),
+                dtype=np.float64,
+                count=count,
+            ),
+            pressure_hpa=np.fromiter(
+                (row.pressure_hpa if row.pressure_hpa is not None else _NAN for row in rows),
+                dtype=np.float64,
+                count=count,
+            ),
+            speed_mps=np.fromiter(
+                (row.speed_mps if row.speed_mps is not None else _NAN for row in rows),
+                dtype=np.float64,
+                count=count,
+            ),
+            direction_deg=np.fromiter(
+                (row.direction_deg if row.direction_deg is not None else _NAN for row in rows),
+                dtype=np.float64,
+                count=count,
+            ),
+            latitude=first.latitude,
+            longitude=first.longitude,
+            altitude_m=first.altitude_m,
+        )
+
+    def slice_window(self, start_utc: datetime, end_utc: datetime) -> MeasurementBatch:
+        """Return the [start_utc, end_utc] sub-window as array views.
+
+        Both bounds are inclusive, matching the repository's SQL range reads,
+        so slicing an already-loaded batch yields exactly what re-reading the
+        sub-window would. The epochs column is stored sorted, so the bounds
+        are found with two binary searches and the column slices share memory
+        with this batch — no per-row comparisons and no copies.
+        """
+        start_index = int(np.searchsorted(self.epochs, int(start_utc.timestamp()), side="left"))
+        end_index = int(np.searchsorted(self.epochs, int(end_utc.timestamp()), side="right"))
+        if start_index == 0 and end_index == len(self):
+            return self
+        return MeasurementBatch(
+            station_name=self.station_name,
+            epochs=self.epochs[start_index:end_index],
+            temperature_c=self.temperature_c[start_index:end_index],
+            pressure_hpa=self.pressure_hpa[start_index:end_index],
+            speed_mps=self.speed_mps[start_index:end_index],
+            direction_deg=self.direction_deg[start_index:end_index],
+            latitude=self.latitude,
+            longitude=self.longitude,
+            altitude_m=self.altitude_m,
+        )
+
+    def to_rows(self) -> list[SourceMeasurement]:
+        """Materialize model rows, mapping NaN back to None.
+
+        The x == x test is the allocation-free NaN check; construction goes
+        through model_construct because the columns came from trusted
+        internal sources.
+        """
+        construct = SourceMeasurement.model_construct
+        from_timestamp = datetime.fromtimestamp
+        return [
+            construct(
+                station_name=self.station_name,
+                measured_at_utc=from_timestamp(epoch, tz=timezone.utc),
+                temperature_c=temperature if temperature == temperature else None,
+                pressure_hpa=pressure if pressure == pressure else None,
+                speed_mps=speed if speed == speed else None,
+                direction_deg=direction if direction == direction else None,
+                latitude=self.latitude,
+                longitude=self.longitude,
+                altitude_m=self.altitude_m,
+            )
+            for epoch, temperature, pressure, speed, direction in zip(
+                self.epochs.tolist(),
+                self.temperature_c.tolist(),
+                self.pressure_hpa.tolist(),
+                self.speed_mps.tolist(),
+                self.direction_deg.tolist(),
+            )
+        ]
@@ -3,25 +3,86 @@ from __future__ import annotations
 import sqlite3
 import json
 import logging
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from urllib.parse import urlparse
+from functools import lru_cache
+from itertools import groupby
+from typing import Final
+
+import numpy as np
 
 from app.models import SourceMeasurement, StationCatalogItem
+from app.services.measurement_batch import MeasurementBatch
+from app.utils.dates import parse_iso_utc
 
 logger = logging.getLogger(__name__)
 
+# Hot-path SQL lives in module-level constants: with per-thread persistent
+# connections, passing the identical string object lets sqlite3's per-connection
+# statement cache reuse the prepared statement instead of re-parsing the SQL.
+_GET_MEASUREMENTS_SQL: Final[str] = """
+    SELECT station_name, measured_at_epoch, temperature_c, pressure_hpa, speed_mps,
+           direction_deg, latitude, longitude, altitude_m
+    FROM measurements
+    WHERE station_id = ?
+      AND measured_at_epoch >= ?
+      AND measured_at_epoch <= ?
+    ORDER BY measured_at_epoch ASC
+    """
+
+_UPSERT_FETCH_WINDOW_SQL: Final[str] = """
+    INSERT INTO fetch_windows (station_id, start_utc, end_utc, fetched_at_utc, fetched_at_epoch, direction_checked)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(station_id, start_utc, end_utc)
+    DO UPDATE SET
+        fetched_at_utc = excluded.fetched_at_utc,
+        fetched_at_epoch = excluded.fetched_at_epoch,
+        direction_checked = excluded.direction_checked
+    """
+
+_HAS_FRESH_WINDOW_SQL: Final[str] = """
+    SELECT 1
+    FROM fetch_windows
+    WHERE station_id = ?
+      AND start_utc <= ?
+      AND end_utc >= ?
+      AND fetched_at_epoch >= ?
+    LIMIT 1
+    """
+
+_HAS_CACHED_WINDOW_SQL: Final[str] = """
+    SELECT 1
+    FROM fetch_windows
+    WHERE station_id = ?
+      AND start_utc <= ?
+      AND end_utc >= ?
+    LIMIT 1
+    """
+
 
 class SQLiteRepository:
+    _URL_SCHEME_PREFIX = "sqlite:"
+    # Stored in PRAGMA user_version once _initialize has built the current
+    # schema; bump whenever tables, columns, or indexes change so existing
+    # databases re-run the migration path exactly once.
+    _SCHEMA_VERSION = 2
+
     def __init__(self, database_url: str) -> None:
-        parsed = urlparse(database_url)
-        if parsed.scheme != "sqlite":
+        # A prefix check and slice replace urlparse here: the only accepted
+        # scheme is sqlite, and pulling in urllib.parse for that costs more
+        # than the whole path normalization below.
+        if not database_url.startswith(self._URL_SCHEME_PREFIX):
             raise ValueError("Only sqlite database URLs are supported.")
+        raw_path = database_url[len(self._URL_SCHEME_PREFIX):]
+        # sqlite://<path>: strip the authority slashes like urlparse did.
+        if raw_path.startswith("//"):
+            raw_path = raw_path[2:]
 
-        if parsed.path in {":memory:", "/:memory:"}:
+        if raw_path in {":memory:", "/:memory:"}:
             self.db_path = ":memory:"
         else:
-            raw_path = parsed.path or ""
             # sqlite:///./file.db -> /./file.db (relative path encoded with leading slash)
             if raw_path.startswith("/./") or raw_path.startswith("/../"):
                 normalized_path = raw_path[1:]
@@ -36,6 +97,15 @@ class SQLiteRepository:
 
             self.db_path = normalized_path or "aemet_cache.db"
 
+        self._local = threading.local()
+        # Monotonic per-station write counters consumed by the service-level
+        # aggregated-result cache. Process-local by design: the cache keyed on
+        # them lives in the same process, so cross-process writers only cost
+        # it a recompute, never a stale hit within this process. The lock
+        # keeps the read-modify-write atomic when foreground and background
+        # writers (stale-window refresh, gap fetches) race on one station.
+        self._data_versions: dict[str, int] = {}
+        self._data_versions_lock = threading.Lock()
         logger.info("Initializing SQLite repository path=%s", self.db_path)
         try:
             self._initialize()
@@ -52,38 +122,69 @@ class SQLiteRepository:
             self.db_path = fallback_path
             self._initialize()
 
-    def _new_connection(self) -> sqlite3.Connection:
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the per-thread cached connection, creating it lazily.
+
+        Opening sqlite3 connections per call costs file-open syscalls and
+        PRAGMA executions on every repository method; each thread instead
+        holds one long-lived connection (sqlite3 connections must not be
+        shared across threads, so thread-local caching is the safe variant).
+        A cached connection is discarded when db_path changes, which covers
+        the fallback-path retry during initialization.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and getattr(self._local, "db_path", None) == self.db_path:
+            return conn
+        if conn is not None:
+            conn.close()
         conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA busy_timeout = 5000")
+        # Per-connection tuning for this cache DB: NORMAL halves fsyncs under
+        # WAL (still durable against application crashes), mmap lets reads come
+        # straight from the page cache without read() syscalls, and a 64 MB
+        # page cache plus in-memory temp store cut read amplification.
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        self._local.conn = conn
+        self._local.db_path = self.db_path
         return conn
 
     @contextmanager
     def _read_connection(self):
-        conn = self._new_connection()
+        conn = self._get_connection()
         conn.execute("PRAGMA query_only = ON")
         try:
             yield conn
         finally:
-            conn.close()
+            conn.execute("PRAGMA query_only = OFF")
 
     @contextmanager
     def _write_connection(self):
-        conn = self._new_connection()
+        conn = self._get_connection()
         try:
             yield conn
-        finally:
-            conn.close()
+        except Exception:
+            conn.rollback()
+            raise
 
     def _initialize(self) -> None:
         with self._write_connection() as conn:
             conn.execute("PRAGMA journal_mode = WAL")
+            # Databases already at the current schema version skip all the DDL
+            # and PRAGMA table_info probing below, which matters when a
+            # repository is constructed per request.
+            if conn.execute("PRAGMA user_version").fetchone()[0] == self._SCHEMA_VERSION:
+                return
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS measurements (
                     station_id TEXT NOT NULL,
                     station_name TEXT NOT NULL,
                     measured_at_utc TEXT NOT NULL,
+                    measured_at_epoch INTEGER,
                     temperature_c REAL,
                     pressure_hpa REAL,
                     speed_mps REAL,
@@ -92,6 +193,7 @@ class SQLiteRepository:
                     longitude REAL,
                     altitude_m REAL,
                     fetched_at_utc TEXT NOT NULL,
+                    fetched_at_epoch INTEGER,
                     PRIMARY KEY (station_id, measured_at_utc)
                 )
                 """
@@ -106,6 +208,7 @@ class SQLiteRepository:
                     start_utc TEXT NOT NULL,
                     end_utc TEXT NOT NULL,
                     fetched_at_utc TEXT NOT NULL,
+                    fetched_at_epoch INTEGER,
                     direction_checked INTEGER NOT NULL DEFAULT 0,
                     PRIMARY KEY (station_id, start_utc, end_utc)
                 )
@@ -125,7 +228,8 @@ class SQLiteRepository:
                     altitude_m REAL,
                     data_endpoint TEXT NOT NULL DEFAULT 'valores-climatologicos-inventario',
                     is_antarctic_station INTEGER NOT NULL DEFAULT 0,
-                    fetched_at_utc TEXT NOT NULL
+                    fetched_at_utc TEXT NOT NULL,
+                    fetched_at_epoch INTEGER
                 )
                 """
             )
@@ -168,6 +272,21 @@ class SQLiteRepository:
             self._ensure_columns(conn)
             self._ensure_station_catalog_columns(conn)
             self._ensure_fetch_windows_columns(conn)
+            # Covering index: get_measurements is satisfied entirely from the
+            # index, skipping the per-row heap lookup for the value columns.
+            # Created after _ensure_columns so legacy databases already have
+            # measured_at_epoch by the time the index references it.
+            conn.execute("DROP INDEX IF EXISTS idx_measurements_station_epoch")
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_measurements_station_epoch_covering
+                ON measurements(
+                    station_id, measured_at_epoch, station_name, temperature_c, pressure_hpa,
+                    speed_mps, direction_deg, latitude, longitude, altitude_m
+                )
+                """
+            )
+            conn.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
             conn.commit()
 
     @staticmethod
@@ -178,10 +297,22 @@ class SQLiteRepository:
             "latitude": "ALTER TABLE measurements ADD COLUMN latitude REAL",
             "longitude": "ALTER TABLE measurements ADD COLUMN longitude REAL",
             "altitude_m": "ALTER TABLE measurements ADD COLUMN altitude_m REAL",
+            "measured_at_epoch": "ALTER TABLE measurements ADD COLUMN measured_at_epoch INTEGER",
+            "fetched_at_epoch": "ALTER TABLE measurements ADD COLUMN fetched_at_epoch INTEGER",
         }
         for column, ddl in required_columns.items():
             if column not in existing_columns:
                 conn.execute(ddl)
+        # Backfill rows written before the epoch column existed so the integer
+        # range predicates in get_measurements see every cached measurement.
+        conn.execute(
+            "UPDATE measurements SET measured_at_epoch = CAST(strftime('%s', measured_at_utc) AS INTEGER) "
+            "WHERE measured_at_epoch IS NULL"
+        )
+        conn.execute(
+            "UPDATE measurements SET fetched_at_epoch = CAST(strftime('%s', fetched_at_utc) AS INTEGER) "
+            "WHERE fetched_at_epoch IS NULL"
+        )
 
     @staticmethod
     def _ensure_station_catalog_columns(conn: sqlite3.Connection) -> None:
@@ -194,20 +325,61 @@ class SQLiteRepository:
             "is_antarctic_station": (
                 "ALTER TABLE station_catalog ADD COLUMN is_antarctic_station INTEGER NOT NULL DEFAULT 0"
             ),
+            "fetched_at_epoch": "ALTER TABLE station_catalog ADD COLUMN fetched_at_epoch INTEGER",
         }
         for column, ddl in required_columns.items():
             if column not in existing_columns:
                 conn.execute(ddl)
+        conn.execute(
+            "UPDATE station_catalog SET fetched_at_epoch = CAST(strftime('%s', fetched_at_utc) AS INTEGER) "
+            "WHERE fetched_at_epoch IS NULL"
+        )
 
     @staticmethod
     def _ensure_fetch_windows_columns(conn: sqlite3.Connection) -> None:
         existing_columns = {row["name"] for row in conn.execute("PRAGMA table_info(fetch_windows)").fetchall()}
         required_columns = {
             "direction_checked": "ALTER TABLE fetch_windows ADD COLUMN direction_checked INTEGER NOT NULL DEFAULT 0",
+            "fetched_at_epoch": "ALTER TABLE fetch_windows ADD COLUMN fetched_at_epoch INTEGER",
         }
         for column, ddl in required_columns.items():
             if column not in existing_columns:
                 conn.execute(ddl)
+        conn.execute(
+            "UPDATE fetch_windows SET fetched_at_epoch = CAST(strftime('%s', fetched_at_utc) AS INTEGER) "
+            "WHERE fetched_at_epoch IS NULL"
+        )
+
+    # 13 bound parameters per row; 76 rows keeps a statement under SQLite's
+    # conservative 999-variable limit while amortizing per-statement overhead.
+    _UPSERT_BATCH_ROWS = 76
+    # Row chunk size used when draining large result sets via fetchmany.
+    _FETCH_CHUNK_ROWS = 1024
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _measurements_upsert_sql(row_count: int) -> str:
+        values = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * row_count)
+        return f"""
+            INSERT INTO measurements (
+                station_id, station_name, measured_at_utc, measured_at_epoch,
+                temperature_c, pressure_hpa, speed_mps, direction_deg,
+                latitude, longitude, altitude_m, fetched_at_utc, fetched_at_epoch
+            ) VALUES {values}
+            ON CONFLICT(station_id, measured_at_utc)
+            DO UPDATE SET
+                station_name=excluded.station_name,
+                measured_at_epoch=excluded.measured_at_epoch,
+                temperature_c=excluded.temperature_c,
+                pressure_hpa=excluded.pressure_hpa,
+                speed_mps=excluded.speed_mps,
+                direction_deg=excluded.direction_deg,
+                latitude=COALESCE(excluded.latitude, measurements.latitude),
+                longitude=COALESCE(excluded.longitude, measurements.longitude),
+                altitude_m=COALESCE(excluded.altitude_m, measurements.altitude_m),
+                fetched_at_utc=excluded.fetched_at_utc,
+                fetched_at_epoch=excluded.fetched_at_epoch
+            """
 
     def upsert_measurements(
         self,
@@ -216,64 +388,56 @@ class SQLiteRepository:
         start_utc: datetime,
         end_utc: datetime,
     ) -> None:
-        now_utc = datetime.utcnow().isoformat()
+        now_utc = datetime.now(timezone.utc).isoformat()
+        now_epoch = int(time.time())
         direction_checked = 1
+        start_iso = start_utc.isoformat()
+        end_iso = end_utc.isoformat()
         logger.debug(
             "Upsert measurements station=%s rows=%d start=%s end=%s",
             station_id,
             len(rows),
-            start_utc.isoformat(),
-            end_utc.isoformat(),
+            start_iso,
+            end_iso,
         )
         with self._write_connection() as conn:
-            conn.executemany(
-                """
-                INSERT INTO measurements (
-                    station_id, station_name, measured_at_utc,
-                    temperature_c, pressure_hpa, speed_mps, direction_deg,
-                    latitude, longitude, altitude_m, fetched_at_utc
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(station_id, measured_at_utc)
-                DO UPDATE SET
-                    station_name=excluded.station_name,
-                    temperature_c=excluded.temperature_c,
-                    pressure_hpa=excluded.pressure_hpa,
-                    speed_mps=excluded.speed_mps,
-                    direction_deg=excluded.direction_deg,
-                    latitude=COALESCE(excluded.latitude, measurements.latitude),
-                    longitude=COALESCE(excluded.longitude, measurements.longitude),
-                    altitude_m=COALESCE(excluded.altitude_m, measurements.altitude_m),
-                    fetched_at_utc=excluded.fetched_at_utc
-                """,
-                [
-                    (
-                        station_id,
-                        row.station_name,
-                        row.measured_at_utc.isoformat(),
-                        row.temperature_c,
-                        row.pressure_hpa,
-                        row.speed_mps,
-                        row.direction_deg,
-                        row.latitude,
-                        row.longitude,
-                        row.altitude_m,
-                        now_utc,
+            # One explicit transaction covers the measurement batches and the
+            # fetch-window upsert, so the whole call costs a single WAL commit.
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            for batch_start in range(0, len(rows), self._UPSERT_BATCH_ROWS):
+                batch = rows[batch_start:batch_start + self._UPSERT_BATCH_ROWS]
+                params: list[object] = []
+                for row in batch:
+                    params.extend(
+                        (
+                            station_id,
+                            row.station_name,
+                            row.measured_at_utc.isoformat(),
+                            int(row.measured_at_utc.timestamp()),
+                            row.temperature_c,
+                            row.pressure_hpa,
+                            row.speed_mps,
+                            row.direction_deg,
+                            row.latitude,
+                            row.longitude,
+                            row.altitude_m,
+                            now_utc,
+                            now_epoch,
+                        )
                     )
-                    for row in rows
-                ],
-            )
+                conn.execute(self._measurements_upsert_sql(len(batch)), params)
             conn.execute(
-                """
-                INSERT INTO fetch_windows (station_id, start_utc, end_utc, fetched_at_utc, direction_checked)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(station_id, start_utc, end_utc)
-                DO UPDATE SET
-                    fetched_at_utc = excluded.fetched_at_utc,
-                    direction_checked = excluded.direction_checked
-                """,
-                (station_id, start_utc.isoformat(), end_utc.isoformat(), now_utc, direction_checked),
+                _UPSERT_FETCH_WINDOW_SQL,
+                (station_id, start_iso, end_iso, now_utc, now_epoch, direction_checked),
             )
             conn.commit()
+        with self._data_versions_lock:
+            self._data_versions[station_id] = self._data_versions.get(station_id, 0) + 1
+
+    def get_data_version(self, station_id: str) -> int:
+        """Counter bumped on every measurement write for the station."""
+        return self._data_versions.get(station_id, 0)
 
     def has_fresh_fetch_window(
         self,
@@ -284,23 +448,55 @@ class SQLiteRepository:
     ) -> bool:
         with self._read_connection() as conn:
             row = conn.execute(
+                _HAS_FRESH_WINDOW_SQL,
+                (
+                    station_id,
+                    start_utc.isoformat(),
+                    end_utc.isoformat(),
+                    int(min_fetched_at_utc.timestamp()),
+                ),
+            ).fetchone()
+        return row is not None
+
+    def get_missing_intervals(
+        self,
+        station_id: str,
+        start_utc: datetime,
+        end_utc: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Parts of [start_utc, end_utc) not covered by any fetched window.
+
+        An ordered walk over the overlapping fetch_windows rows computes the
+        interval difference, so a request that extends an already-cached
+        range only reports the uncovered tail instead of the full window.
+        Returns an empty list when the union of cached windows covers the
+        whole range.
+        """
+        with self._read_connection() as conn:
+            rows = conn.execute(
                 """
-                SELECT fetched_at_utc
+                SELECT start_utc, end_utc
                 FROM fetch_windows
                 WHERE station_id = ?
-                  AND start_utc <= ?
-                  AND end_utc >= ?
-                ORDER BY fetched_at_utc DESC
-                LIMIT 1
+                  AND start_utc < ?
+                  AND end_utc > ?
+                ORDER BY start_utc ASC
                 """,
-                (station_id, start_utc.isoformat(), end_utc.isoformat()),
-            ).fetchone()
-        if row is None:
-            return False
-        fetched_at = datetime.fromisoformat(row["fetched_at_utc"])
-        if fetched_at.tzinfo is None:
-            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
-        return fetched_at >= min_fetched_at_utc
+                (station_id, end_utc.isoformat(), start_utc.isoformat()),
+            ).fetchall()
+        missing: list[tuple[datetime, datetime]] = []
+        cursor_utc = start_utc
+        for row in rows:
+            window_start = parse_iso_utc(row["start_utc"])
+            window_end = parse_iso_utc(row["end_utc"])
+            if window_start > cursor_utc:
+                missing.append((cursor_utc, window_start))
+            if window_end > cursor_utc:
+                cursor_utc = window_end
+            if cursor_utc >= end_utc:
+                return missing
+        missing.append((cursor_utc, end_utc))
+        return missing
 
     def has_cached_fetch_window(
         self,
@@ -310,14 +506,7 @@ class SQLiteRepository:
     ) -> bool:
         with self._read_connection() as conn:
             row = conn.execute(
-                """
-                SELECT 1
-                FROM fetch_windows
-                WHERE station_id = ?
-                  AND start_utc <= ?
-                  AND end_utc >= ?
-                LIMIT 1
-                """,
+                _HAS_CACHED_WINDOW_SQL,
                 (station_id, start_utc.isoformat(), end_utc.isoformat()),
             ).fetchone()
         return row is not None
@@ -336,7 +525,7 @@ class SQLiteRepository:
                 WHERE station_id = ?
                   AND start_utc <= ?
                   AND end_utc >= ?
-                ORDER BY fetched_at_utc DESC
+                ORDER BY fetched_at_epoch DESC
                 LIMIT 1
                 """,
                 (station_id, start_utc.isoformat(), end_utc.isoformat()),
@@ -351,7 +540,8 @@ class SQLiteRepository:
         start_utc: datetime,
         end_utc: datetime,
     ) -> None:
-        now_utc = datetime.utcnow().isoformat()
+        now_utc = datetime.now(timezone.utc).isoformat()
+        now_epoch = int(time.time())
         with self._write_connection() as conn:
             conn.execute(
                 """
@@ -365,8 +555,8 @@ class SQLiteRepository:
             )
             conn.execute(
                 """
-                INSERT INTO fetch_windows (station_id, start_utc, end_utc, fetched_at_utc, direction_checked)
-                SELECT ?, ?, ?, ?, 1
+                INSERT INTO fetch_windows (station_id, start_utc, end_utc, fetched_at_utc, fetched_at_epoch, direction_checked)
+                SELECT ?, ?, ?, ?, ?, 1
                 WHERE NOT EXISTS (
                     SELECT 1
                     FROM fetch_windows
@@ -380,6 +570,7 @@ class SQLiteRepository:
                     start_utc.isoformat(),
                     end_utc.isoformat(),
                     now_utc,
+                    now_epoch,
                     station_id,
                     start_utc.isoformat(),
                     end_utc.isoformat(),
@@ -389,43 +580,166 @@ class SQLiteRepository:
 
     def get_measurements(self, station_id: str, start_utc: datetime, end_utc: datetime) -> list[SourceMeasurement]:
         with self._read_connection() as conn:
-            result = conn.execute(
-                """
-                SELECT station_name, measured_at_utc, temperature_c, pressure_hpa, speed_mps,
-                       direction_deg, latitude, longitude, altitude_m
+            cursor = conn.execute(
+                _GET_MEASUREMENTS_SQL,
+                (station_id, int(start_utc.timestamp()), int(end_utc.timestamp())),
+            )
+            # Plain tuples + positional unpacking: sqlite3.Row's by-name access
+            # scans the cursor description per key, which adds up over
+            # thousands of rows on this hot read path.
+            cursor.row_factory = None
+            from_timestamp = datetime.fromtimestamp
+            out: list[SourceMeasurement] = []
+            # Drain in fetchmany chunks so the C-side row buffer never holds
+            # the whole window alongside the Python model list.
+            while True:
+                chunk = cursor.fetchmany(self._FETCH_CHUNK_ROWS)
+                if not chunk:
+                    break
+                out.extend(
+                    SourceMeasurement(
+                        station_name=name,
+                        measured_at_utc=from_timestamp(epoch, tz=timezone.utc),
+                        temperature_c=temperature_c,
+                        pressure_hpa=pressure_hpa,
+                        speed_mps=speed_mps,
+                        direction_deg=direction_deg,
+                        latitude=latitude,
+                        longitude=longitude,
+                        altitude_m=altitude_m,
+                    )
+                    for (
+                        name,
+                        epoch,
+                        temperature_c,
+                        pressure_hpa,
+                        speed_mps,
+                        direction_deg,
+                        latitude,
+                        longitude,
+                        altitude_m,
+                    ) in chunk
+                )
+        return out
+
+    def get_measurements_batch(
+        self,
+        station_id: str,
+        start_utc: datetime,
+        end_utc: datetime,
+    ) -> MeasurementBatch:
+        """Read a window straight into columnar arrays.
+
+        Skips the per-row SourceMeasurement construction entirely: the tuple
+        rows from SQLite go directly into the MeasurementBatch columns, and
+        model objects are only built later for whatever survives aggregation.
+        """
+        with self._read_connection() as conn:
+            cursor = conn.execute(
+                _GET_MEASUREMENTS_SQL,
+                (station_id, int(start_utc.timestamp()), int(end_utc.timestamp())),
+            )
+            cursor.row_factory = None
+            rows = cursor.fetchall()
+        if not rows:
+            return MeasurementBatch.empty()
+        nan = float("nan")
+        count = len(rows)
+        first = rows[0]
+        return MeasurementBatch(
+            station_name=first[0],
+            epochs=np.fromiter((row[1] for row in rows), dtype=np.int64, count=count),
+            temperature_c=np.fromiter(
+                (row[2] if row[2] is not None else nan for row in rows), dtype=np.float64, count=count
+            ),
+            pressure_hpa=np.fromiter(
+                (row[3] if row[3] is not None else nan for row in rows), dtype=np.float64, count=count
+            ),
+            speed_mps=np.fromiter(
+                (row[4] if row[4] is not None else nan for row in rows), dtype=np.float64, count=count
+            ),
+            direction_deg=np.fromiter(
+                (row[5] if row[5] is not None else nan for row in rows), dtype=np.float64, count=count
+            ),
+            latitude=first[6],
+            longitude=first[7],
+            altitude_m=first[8],
+        )
+
+    def get_measurements_for_stations(
+        self,
+        station_ids: list[str],
+        start_utc: datetime,
+        end_utc: datetime,
+    ) -> dict[str, list[SourceMeasurement]]:
+        """Fetch measurements for several stations in one query.
+
+        Calling get_measurements per station pays the query setup once per
+        station; a single ``station_id IN (...)`` scan plus one groupby pass
+        returns the same data with one round trip. Stations with no rows in
+        the range map to an empty list.
+        """
+        out: dict[str, list[SourceMeasurement]] = {station_id: [] for station_id in station_ids}
+        if not station_ids:
+            return out
+        placeholders = ",".join("?" * len(station_ids))
+        with self._read_connection() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT station_id, station_name, measured_at_epoch, temperature_c, pressure_hpa,
+                       speed_mps, direction_deg, latitude, longitude, altitude_m
                 FROM measurements
-                WHERE station_id = ?
-                  AND measured_at_utc >= ?
-                  AND measured_at_utc <= ?
-                ORDER BY measured_at_utc ASC
+                WHERE station_id IN ({placeholders})
+                  AND measured_at_epoch >= ?
+                  AND measured_at_epoch <= ?
+                ORDER BY station_id, measured_at_epoch ASC
                 """,
-                (station_id, start_utc.isoformat(), end_utc.isoformat()),
-            ).fetchall()
-        return [
-            SourceMeasurement(
-                station_name=row["station_name"],
-                measured_at_utc=datetime.fromisoformat(row["measured_at_utc"]),
-                temperature_c=row["temperature_c"],
-                pressure_hpa=row["pressure_hpa"],
-                speed_mps=row["speed_mps"],
-                direction_deg=row["direction_deg"],
-                latitude=row["latitude"],
-                longitude=row["longitude"],
-                altitude_m=row["altitude_m"],
+                (*station_ids, int(start_utc.timestamp()), int(end_utc.timestamp())),
             )
-            for row in result
-        ]
+            cursor.row_factory = None
+            from_timestamp = datetime.fromtimestamp
+            rows = cursor.fetchall()
+        # Rows arrive sorted by station_id, so one groupby pass splits them.
+        for station_id, group in groupby(rows, key=lambda row: row[0]):
+            out[station_id] = [
+                SourceMeasurement(
+                    station_name=name,
+                    measured_at_utc=from_timestamp(epoch, tz=timezone.utc),
+                    temperature_c=temperature_c,
+                    pressure_hpa=pressure_hpa,
+                    speed_mps=speed_mps,
+                    direction_deg=direction_deg,
+                    latitude=latitude,
+                    longitude=longitude,
+                    altitude_m=altitude_m,
+                )
+                for (
+                    _station_id,
+                    name,
+                    epoch,
+                    temperature_c,
+                    pressure_hpa,
+                    speed_mps,
+                    direction_deg,
+                    latitude,
+                    longitude,
+                    altitude_m,
+                ) in group
+            ]
+        return out
 
     def upsert_station_catalog(self, rows: list[StationCatalogItem]) -> datetime:
         now_utc = datetime.now(timezone.utc)
         logger.debug("Upsert station catalog rows=%d", len(rows))
         with self._write_connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
             conn.executemany(
                 """
                 INSERT INTO station_catalog (
                     station_id, station_name, province, latitude, longitude, altitude_m,
-                    data_endpoint, is_antarctic_station, fetched_at_utc
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    data_endpoint, is_antarctic_station, fetched_at_utc, fetched_at_epoch
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(station_id)
                 DO UPDATE SET
                     station_name=excluded.station_name,
@@ -435,7 +749,8 @@ class SQLiteRepository:
                     altitude_m=excluded.altitude_m,
                     data_endpoint=excluded.data_endpoint,
                     is_antarctic_station=excluded.is_antarctic_station,
-                    fetched_at_utc=excluded.fetched_at_utc
+                    fetched_at_utc=excluded.fetched_at_utc,
+                    fetched_at_epoch=excluded.fetched_at_epoch
                 """,
                 [
                     (
@@ -448,6 +763,7 @@ class SQLiteRepository:
                         row.data_endpoint,
                         int(row.is_antarctic_station),
                         now_utc.isoformat(),
+                        int(now_utc.timestamp()),
                     )
                     for row in rows
                 ],
@@ -459,52 +775,65 @@ class SQLiteRepository:
         with self._read_connection() as conn:
             row = conn.execute(
                 """
-                SELECT MAX(fetched_at_utc) AS last_fetched_at_utc
+                SELECT MAX(fetched_at_epoch) AS last_fetched_at_epoch
                 FROM station_catalog
                 """
             ).fetchone()
-        if row is None or row["last_fetched_at_utc"] is None:
+        if row is None or row["last_fetched_at_epoch"] is None:
             return False
-        fetched_at = datetime.fromisoformat(row["last_fetched_at_utc"])
-        if fetched_at.tzinfo is None:
-            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
-        return fetched_at >= min_fetched_at_utc
+        return row["last_fetched_at_epoch"] >= int(min_fetched_at_utc.timestamp())
 
     def get_station_catalog_last_fetched_at(self) -> datetime | None:
         with self._read_connection() as conn:
             row = conn.execute(
                 """
-                SELECT MAX(fetched_at_utc) AS last_fetched_at_utc
+                SELECT MAX(fetched_at_epoch) AS last_fetched_at_epoch
                 FROM station_catalog
                 """
             ).fetchone()
-        if row is None or row["last_fetched_at_utc"] is None:
+        if row is None or row["last_fetched_at_epoch"] is None:
             return None
-        return datetime.fromisoformat(row["last_fetched_at_utc"])
+        return datetime.fromtimestamp(row["last_fetched_at_epoch"], tz=timezone.utc)
 
     def get_station_catalog(self) -> list[StationCatalogItem]:
         with self._read_connection() as conn:
-            result = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT station_id, station_name, province, latitude, longitude, altitude_m,
                        data_endpoint, is_antarctic_station
                 FROM station_catalog
                 ORDER BY station_name ASC
                 """
-            ).fetchall()
-        return [
-            StationCatalogItem(
-                stationId=row["station_id"],
-                stationName=row["station_name"],
-                province=row["province"],
-                latitude=row["latitude"],
-                longitude=row["longitude"],
-                altitude=row["altitude_m"],
-                dataEndpoint=row["data_endpoint"],
-                isAntarcticStation=bool(row["is_antarctic_station"]),
             )
-            for row in result
-        ]
+            cursor.row_factory = None
+            out: list[StationCatalogItem] = []
+            while True:
+                chunk = cursor.fetchmany(self._FETCH_CHUNK_ROWS)
+                if not chunk:
+                    break
+                out.extend(
+                    StationCatalogItem(
+                        stationId=station_id,
+                        stationName=station_name,
+                        province=province,
+                        latitude=latitude,
+                        longitude=longitude,
+                        altitude=altitude_m,
+                        dataEndpoint=data_endpoint,
+                        isAntarcticStation=bool(is_antarctic_station),
+                    )
+                    for (
+                        station_id,
+                        station_name,
+                        province,
+                        latitude,
+                        longitude,
+                        altitude_m,
+                        data_endpoint,
+                        is_antarctic_station,
+                    ) in chunk
+                )
+        return out
 
     def get_station_catalog_item(self, station_id: str) -> StationCatalogItem | None:
         with self._read_connection() as conn:
@@ -545,7 +874,7 @@ class SQLiteRepository:
             ).fetchone()
         if row is None or row["latest_measured_at_utc"] is None:
             return None
-        return datetime.fromisoformat(row["latest_measured_at_utc"])
+        return parse_iso_utc(row["latest_measured_at_utc"])
 
     def get_latest_measurement(self, station_id: str) -> SourceMeasurement | None:
         with self._read_connection() as conn:
@@ -564,7 +893,7 @@ class SQLiteRepository:
             return None
         return SourceMeasurement(
             station_name=row["station_name"],
-            measured_at_utc=datetime.fromisoformat(row["measured_at_utc"]),
+            measured_at_utc=parse_iso_utc(row["measured_at_utc"]),
             temperature_c=row["temperature_c"],
             pressure_hpa=row["pressure_hpa"],
             speed_mps=row["speed_mps"],
@@ -1,4 +1,4 @@
-from app.utils.dates import ensure_max_window_days
+from app.utils.dates import ensure_max_window_days, parse_iso_utc
 
-__all__ = ["ensure_max_window_days"]
+__all__ = ["ensure_max_window_days", "parse_iso_utc"]
 
@@ -1,4 +1,36 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+
+def parse_iso_utc(raw: str) -> datetime | None:
+    """Parse an ISO-8601 timestamp into an aware UTC datetime.
+
+    AEMET and the SQLite cache both emit the fixed layout
+    ``YYYY-MM-DDTHH:MM:SS`` with an optional ``Z``/``+00:00`` suffix, so the
+    common case is decoded with direct ``int()`` slices instead of the
+    general-purpose ``fromisoformat`` machinery (and without the ``Z``
+    replacement allocation). Anything else — offsets, microseconds — falls
+    back to ``fromisoformat``; naive values are assumed to be UTC.
+    """
+    if len(raw) in (19, 20, 25) and raw[19:] in ("", "Z", "+00:00") and raw[4] == "-" and raw[10] == "T":
+        try:
+            return datetime(
+                int(raw[0:4]),
+                int(raw[5:7]),
+                int(raw[8:10]),
+                int(raw[11:13]),
+                int(raw[14:16]),
+                int(raw[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            return None
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
 
 
 def ensure_max_window_days(start: datetime, end: datetime, max_days: int = 30) -> None:
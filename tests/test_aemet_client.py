@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -253,6 +254,115 @@ def test_fetch_station_data_parses_direction_numeric_with_symbol():
     assert rows[0].direction_deg == 270.0
 
 
+class FakeAsyncHttpClient:
+    """Fake httpx.AsyncClient that resolves canned responses by URL substring."""
+
+    def __init__(self, responses_by_url_fragment):
+        self._responses = responses_by_url_fragment
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        return None
+
+    async def get(self, url, **_kwargs):
+        for fragment, response in self._responses.items():
+            if fragment in url:
+                return response
+        raise AssertionError(f"No canned response for URL {url}")
+
+
+def test_fetch_many_stations_fetches_all_stations_concurrently():
+    fake_async_client = FakeAsyncHttpClient(
+        {
+            "estacion/89064": FakeResponse({"estado": 200, "datos": "https://example.test/89064.json"}),
+            "estacion/89070": FakeResponse({"estado": 200, "datos": "https://example.test/89070.json"}),
+            "89064.json": FakeResponse(
+                [{"nombre": "JUAN CARLOS I", "fhora": "2025-02-18T10:00:00Z", "temp": "-1.7"}]
+            ),
+            "89070.json": FakeResponse(
+                [{"nombre": "GABRIEL DE CASTILLA", "fhora": "2025-02-18T10:00:00Z", "temp": "0.4"}]
+            ),
+        }
+    )
+    client = _make_client([], api_key="ok-key", min_request_interval_seconds=0.0)
+    client._new_async_client = lambda: fake_async_client
+
+    out = asyncio.run(
+        client.fetch_many_stations(
+            start_utc=datetime(2025, 2, 18, 9, 0, tzinfo=UTC),
+            end_utc=datetime(2025, 2, 18, 11, 0, tzinfo=UTC),
+            station_ids=["89064", "89070"],
+        )
+    )
+
+    assert set(out) == {"89064", "89070"}
+    assert out["89064"][0].temperature_c == -1.7
+    assert out["89070"][0].temperature_c == 0.4
+
+
+class CountingAsyncHttpClient(FakeAsyncHttpClient):
+    """Counts GETs and yields to the event loop so concurrent callers overlap."""
+
+    def __init__(self, responses_by_url_fragment):
+        super().__init__(responses_by_url_fragment)
+        self.get_calls = 0
+
+    async def get(self, url, **kwargs):
+        self.get_calls += 1
+        await asyncio.sleep(0)
+        return await super().get(url, **kwargs)
+
+
+def test_fetch_station_data_coalesced_deduplicates_concurrent_identical_fetches():
+    fake_async_client = CountingAsyncHttpClient(
+        {
+            "estacion/89064": FakeResponse({"estado": 200, "datos": "https://example.test/89064.json"}),
+            "89064.json": FakeResponse(
+                [{"nombre": "JUAN CARLOS I", "fhora": "2025-02-18T10:00:00Z", "temp": "-1.7"}]
+            ),
+        }
+    )
+    client = _make_client([], api_key="ok-key", min_request_interval_seconds=0.0)
+    client._new_async_client = lambda: fake_async_client
+
+    async def run_concurrent_fetches():
+        return await asyncio.gather(
+            *[
+                client.fetch_station_data_coalesced(
+                    start_utc=datetime(2025, 2, 18, 9, 0, tzinfo=UTC),
+                    end_utc=datetime(2025, 2, 18, 11, 0, tzinfo=UTC),
+                    station_id="89064",
+                )
+                for _ in range(3)
+            ]
+        )
+
+    results = asyncio.run(run_concurrent_fetches())
+
+    # One metadata GET and one data GET despite three concurrent callers.
+    assert fake_async_client.get_calls == 2
+    assert all(rows[0].temperature_c == -1.7 for rows in results)
+
+
+def test_parse_projected_rows_keeps_only_known_keys():
+    client = AemetClient(api_key="ok-key")
+    payload = (
+        b'[{"NOMBRE": "JUAN CARLOS I", "FHORA": "2025-02-18T10:00:00Z", "TEMP": "-1.7",'
+        b' "MES": 2, "UBI": "ignored", "NIEVE": 0}]'
+    )
+    response = FakeResponse(None)
+    response.content = payload
+
+    rows = client._parse_projected_rows(response, AemetClient._PROJECTED_DATA_ROW_KEYS)
+
+    if client._thread_json_parser() is None:
+        assert rows is None
+    else:
+        assert rows == [{"nombre": "JUAN CARLOS I", "fhora": "2025-02-18T10:00:00Z", "temp": "-1.7"}]
+
+
 def test_fetch_station_data_parses_ddd_direction_key():
     responses = [
         FakeResponse({"estado": 200, "datos": "https://example.test/data.json"}),
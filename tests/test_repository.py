@@ -0,0 +1,199 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models import SourceMeasurement
+from app.services.repository import SQLiteRepository
+
+
+def _make_repo(tmp_path):
+    return SQLiteRepository(f"sqlite:///{tmp_path}/cache.db")
+
+
+def _measurement(measured_at_utc, temperature=1.5):
+    return SourceMeasurement(
+        station_name="JUAN CARLOS I",
+        measured_at_utc=measured_at_utc,
+        temperature_c=temperature,
+        pressure_hpa=980.0,
+        speed_mps=4.2,
+        direction_deg=180.0,
+        latitude=-62.66,
+        longitude=-60.39,
+        altitude_m=12.0,
+    )
+
+
+def test_upsert_and_get_measurements_roundtrip(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+    rows = [
+        _measurement(datetime(2025, 2, 18, 10, 0, tzinfo=timezone.utc), temperature=-1.7),
+        _measurement(datetime(2025, 2, 18, 10, 10, tzinfo=timezone.utc), temperature=-1.5),
+    ]
+
+    repo.upsert_measurements(station_id="89064", rows=rows, start_utc=start, end_utc=end)
+    out = repo.get_measurements("89064", start, end)
+
+    assert [row.measured_at_utc for row in out] == [row.measured_at_utc for row in rows]
+    assert out[0].temperature_c == -1.7
+    assert out[1].temperature_c == -1.5
+    assert repo.has_cached_fetch_window("89064", start, end)
+
+
+def test_get_measurements_filters_by_range_and_station(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+    inside = _measurement(datetime(2025, 2, 10, 12, 0, tzinfo=timezone.utc))
+    repo.upsert_measurements(station_id="89064", rows=[inside], start_utc=start, end_utc=end)
+    repo.upsert_measurements(
+        station_id="89070",
+        rows=[_measurement(datetime(2025, 2, 10, 12, 0, tzinfo=timezone.utc))],
+        start_utc=start,
+        end_utc=end,
+    )
+
+    narrow = repo.get_measurements(
+        "89064",
+        inside.measured_at_utc - timedelta(minutes=5),
+        inside.measured_at_utc + timedelta(minutes=5),
+    )
+    outside = repo.get_measurements("89064", end, end + timedelta(days=7))
+
+    assert len(narrow) == 1
+    assert narrow[0].measured_at_utc == inside.measured_at_utc
+    assert outside == []
+
+
+def test_upsert_measurements_handles_batches_larger_than_one_statement(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+    rows = [
+        _measurement(start + timedelta(minutes=10 * index), temperature=float(index))
+        for index in range(2 * SQLiteRepository._UPSERT_BATCH_ROWS + 7)
+    ]
+
+    repo.upsert_measurements(station_id="89064", rows=rows, start_utc=start, end_utc=end)
+    # Re-upserting the same rows must update in place, not duplicate.
+    repo.upsert_measurements(station_id="89064", rows=rows, start_utc=start, end_utc=end)
+    out = repo.get_measurements("89064", start, end)
+
+    assert len(out) == len(rows)
+    assert out[-1].temperature_c == float(len(rows) - 1)
+
+
+def test_get_measurements_batch_matches_row_reads(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+    rows = [
+        _measurement(datetime(2025, 2, 18, 10, 0, tzinfo=timezone.utc), temperature=-1.7),
+        _measurement(datetime(2025, 2, 18, 10, 10, tzinfo=timezone.utc), temperature=-1.5),
+    ]
+    repo.upsert_measurements(station_id="89064", rows=rows, start_utc=start, end_utc=end)
+
+    batch = repo.get_measurements_batch("89064", start, end)
+
+    assert len(batch) == 2
+    assert batch.station_name == "JUAN CARLOS I"
+    assert batch.to_rows() == repo.get_measurements("89064", start, end)
+    assert len(repo.get_measurements_batch("89064", end, end + timedelta(days=7))) == 0
+
+
+def test_measurement_batch_slice_window_uses_epoch_bounds(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+    rows = [
+        _measurement(datetime(2025, 2, 18, 10, 0, tzinfo=timezone.utc), temperature=-1.7),
+        _measurement(datetime(2025, 2, 18, 10, 10, tzinfo=timezone.utc), temperature=-1.5),
+        _measurement(datetime(2025, 2, 18, 10, 20, tzinfo=timezone.utc), temperature=-1.2),
+    ]
+    repo.upsert_measurements(station_id="89064", rows=rows, start_utc=start, end_utc=end)
+    batch = repo.get_measurements_batch("89064", start, end)
+
+    # Bounds are inclusive, so slicing must match a fresh range read.
+    middle = batch.slice_window(rows[1].measured_at_utc, rows[1].measured_at_utc)
+    assert len(middle) == 1
+    assert middle.to_rows() == repo.get_measurements("89064", rows[1].measured_at_utc, rows[1].measured_at_utc)
+    tail = batch.slice_window(rows[1].measured_at_utc, end)
+    assert tail.to_rows() == repo.get_measurements("89064", rows[1].measured_at_utc, end)
+    assert batch.slice_window(start, end) is batch
+    assert len(batch.slice_window(end, end + timedelta(days=7))) == 0
+
+
+def test_get_measurements_for_stations_groups_by_station(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+    repo.upsert_measurements(
+        station_id="89064",
+        rows=[
+            _measurement(datetime(2025, 2, 10, 12, 0, tzinfo=timezone.utc)),
+            _measurement(datetime(2025, 2, 10, 12, 10, tzinfo=timezone.utc)),
+        ],
+        start_utc=start,
+        end_utc=end,
+    )
+    repo.upsert_measurements(
+        station_id="89070",
+        rows=[_measurement(datetime(2025, 2, 11, 9, 0, tzinfo=timezone.utc))],
+        start_utc=start,
+        end_utc=end,
+    )
+
+    out = repo.get_measurements_for_stations(["89064", "89070", "89055"], start, end)
+
+    assert sorted(out) == ["89055", "89064", "89070"]
+    assert len(out["89064"]) == 2
+    assert len(out["89070"]) == 1
+    assert out["89055"] == []
+    assert out["89064"] == repo.get_measurements("89064", start, end)
+
+
+def test_get_missing_intervals_reports_only_uncovered_gaps(tmp_path):
+    repo = _make_repo(tmp_path)
+    day = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    repo.upsert_measurements(station_id="89064", rows=[], start_utc=day, end_utc=day + timedelta(hours=1))
+    repo.upsert_measurements(
+        station_id="89064",
+        rows=[],
+        start_utc=day + timedelta(hours=2),
+        end_utc=day + timedelta(hours=3),
+    )
+
+    assert repo.get_missing_intervals("89064", day, day + timedelta(hours=1)) == []
+    assert repo.get_missing_intervals("89064", day, day + timedelta(hours=4)) == [
+        (day + timedelta(hours=1), day + timedelta(hours=2)),
+        (day + timedelta(hours=3), day + timedelta(hours=4)),
+    ]
+    # Other stations' windows do not count as coverage.
+    assert repo.get_missing_intervals("89070", day, day + timedelta(hours=1)) == [
+        (day, day + timedelta(hours=1)),
+    ]
+
+
+def test_get_data_version_bumps_per_station_on_upsert(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+
+    assert repo.get_data_version("89064") == 0
+    repo.upsert_measurements(station_id="89064", rows=[], start_utc=start, end_utc=end)
+    repo.upsert_measurements(station_id="89064", rows=[], start_utc=start, end_utc=end)
+    repo.upsert_measurements(station_id="89070", rows=[], start_utc=start, end_utc=end)
+
+    assert repo.get_data_version("89064") == 2
+    assert repo.get_data_version("89070") == 1
+
+
+def test_has_fresh_fetch_window_respects_min_fetched_at(tmp_path):
+    repo = _make_repo(tmp_path)
+    start = datetime(2025, 2, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2025, 3, 1, 0, 0, tzinfo=timezone.utc)
+    repo.upsert_measurements(station_id="89064", rows=[], start_utc=start, end_utc=end)
+
+    now_utc = datetime.now(timezone.utc)
+    assert repo.has_fresh_fetch_window("89064", start, end, now_utc - timedelta(hours=1))
+    assert not repo.has_fresh_fetch_window("89064", start, end, now_utc + timedelta(hours=1))
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
@@ -12,6 +13,7 @@ from app.models import (
     WindFarmSimulationParams,
 )
 from app.services.antarctic_service import AntarcticService
+from app.services.measurement_batch import MeasurementBatch
 from app.core.config import Settings
 
 UTC = ZoneInfo("UTC")
@@ -44,6 +46,11 @@ class FakeRepo:
     def get_measurements(self, station_id, start_utc, end_utc):
         return self.rows
 
+    def get_measurements_batch(self, station_id, start_utc, end_utc):
+        # Mirror the real repository's batch reader so service tests exercise
+        # the columnar aggregation path instead of the row fallback.
+        return MeasurementBatch.from_rows(self.get_measurements(station_id, start_utc, end_utc))
+
     def has_fresh_station_catalog(self, min_fetched_at_utc):
         return self.station_fresh
 
@@ -309,6 +316,198 @@ def test_cache_miss_fetches_remote_and_updates_db():
     assert repo.upsert_calls == 1
 
 
+def test_get_data_multi_fetches_each_station_and_keys_results_by_label():
+    rows = [
+        SourceMeasurement(station_name="X", measured_at_utc=datetime(2024, 1, 1, 0, 0, tzinfo=UTC), temperature_c=1.0)
+    ]
+    settings = Settings(
+        aemet_api_key="dummy",
+        database_url="sqlite:///:memory:",
+        request_timeout_seconds=1.0,
+        gabriel_station_id="1",
+        juan_station_id="2",
+        cache_freshness_seconds=3600,
+        station_catalog_freshness_seconds=7 * 24 * 60 * 60,
+    )
+    repo = WindowAwareRepo(rows)
+    client = FakeClient(rows)
+    service = AntarcticService(settings, repo, client)
+
+    out = service.get_data_multi(
+        stations=[Station.GABRIEL_DE_CASTILLA, Station.JUAN_CARLOS_I],
+        start_local=datetime(2024, 1, 1, 0, 0, tzinfo=UTC),
+        end_local=datetime(2024, 1, 1, 1, 0, tzinfo=UTC),
+        aggregation=TimeAggregation.NONE,
+        selected_types=[],
+    )
+
+    assert sorted(out) == sorted([Station.GABRIEL_DE_CASTILLA.value, Station.JUAN_CARLOS_I.value])
+    assert all(len(series) == 1 for series in out.values())
+    assert client.calls == 2
+    assert repo.upsert_calls == 2
+
+
+def test_stale_cached_window_is_served_and_refreshed_in_background():
+    class StaleWindowRepo(FakeRepo):
+        # Cached two hours ago: past the 1h freshness delta but inside the
+        # stale allowance, so the window should be served and re-fetched.
+        def __init__(self, rows):
+            super().__init__(rows, has_fresh_cache=True)
+            self.fetched_at_utc = datetime.now(UTC) - timedelta(hours=2)
+
+        def has_fresh_fetch_window(self, station_id, start_utc, end_utc, min_fetched_at_utc):
+            return self.fetched_at_utc >= min_fetched_at_utc
+
+    rows = [
+        SourceMeasurement(station_name="X", measured_at_utc=datetime(2024, 1, 1, 0, 0, tzinfo=UTC), temperature_c=1.0)
+    ]
+    settings = Settings(
+        aemet_api_key="dummy",
+        database_url="sqlite:///:memory:",
+        request_timeout_seconds=1.0,
+        gabriel_station_id="1",
+        juan_station_id="2",
+        cache_freshness_seconds=3600,
+        station_catalog_freshness_seconds=7 * 24 * 60 * 60,
+    )
+    repo = StaleWindowRepo(rows)
+    client = FakeClient(rows)
+    service = AntarcticService(settings, repo, client)
+
+    out = service.get_data(
+        station=Station.GABRIEL_DE_CASTILLA,
+        start_local=datetime(2024, 1, 1, 0, 0, tzinfo=UTC),
+        end_local=datetime(2024, 1, 1, 1, 0, tzinfo=UTC),
+        aggregation=TimeAggregation.NONE,
+        selected_types=[],
+    )
+
+    assert len(out) == 1
+    deadline = time.monotonic() + 5.0
+    while repo.upsert_calls < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.calls == 1
+    assert repo.upsert_calls == 1
+
+
+def test_direction_recovery_refetches_full_window_even_when_intervals_covered():
+    stale_rows = [
+        SourceMeasurement(
+            station_name="X",
+            measured_at_utc=datetime(2024, 1, 1, 0, 5, tzinfo=UTC),
+            temperature_c=1.0,
+            speed_mps=5.0,
+            direction_deg=None,
+        )
+    ]
+    recovered_rows = [
+        SourceMeasurement(
+            station_name="X",
+            measured_at_utc=datetime(2024, 1, 1, 0, 5, tzinfo=UTC),
+            temperature_c=1.0,
+            speed_mps=5.0,
+            direction_deg=45.0,
+        )
+    ]
+
+    class GapAwareRepo(FakeRepo):
+        # Mirrors the real repository: the cached window is fully covered,
+        # so the interval difference reports no gaps. The direction-recovery
+        # refresh must still force a full-window re-fetch.
+        def get_missing_intervals(self, station_id, start_utc, end_utc):
+            return []
+
+    settings = Settings(
+        aemet_api_key="dummy",
+        database_url="sqlite:///:memory:",
+        request_timeout_seconds=1.0,
+        gabriel_station_id="1",
+        juan_station_id="2",
+        cache_freshness_seconds=3600,
+        station_catalog_freshness_seconds=7 * 24 * 60 * 60,
+    )
+    repo = GapAwareRepo(stale_rows, has_fresh_cache=True)
+    client = FakeClient(recovered_rows)
+    service = AntarcticService(settings, repo, client)
+
+    out = service.get_data(
+        station=Station.GABRIEL_DE_CASTILLA,
+        start_local=datetime(2024, 1, 1, 0, 0, tzinfo=UTC),
+        end_local=datetime(2024, 1, 1, 1, 0, tzinfo=UTC),
+        aggregation=TimeAggregation.NONE,
+        selected_types=[],
+    )
+
+    assert client.calls == 1
+    assert repo.upsert_calls == 1
+    assert out[0].direction_deg == 45.0
+
+
+def test_repeated_identical_queries_reuse_aggregated_output():
+    class VersionedRepo(FakeRepo):
+        def __init__(self, rows):
+            super().__init__(rows, has_fresh_cache=True)
+            self.read_calls = 0
+            self._version = 0
+
+        def upsert_measurements(self, station_id, rows, start_utc, end_utc):
+            super().upsert_measurements(station_id, rows, start_utc, end_utc)
+            self._version += 1
+
+        def get_data_version(self, station_id):
+            return self._version
+
+        def is_fetch_window_direction_checked(self, station_id, start_utc, end_utc):
+            # Skip the direction-recovery probe so read_calls counts only the
+            # aggregation pipeline's reads.
+            return True
+
+        def get_measurements(self, station_id, start_utc, end_utc):
+            self.read_calls += 1
+            return self.rows
+
+    rows = [
+        SourceMeasurement(station_name="X", measured_at_utc=datetime(2024, 1, 1, 0, 5, tzinfo=UTC), temperature_c=10.0),
+        SourceMeasurement(station_name="X", measured_at_utc=datetime(2024, 1, 1, 0, 15, tzinfo=UTC), temperature_c=14.0),
+    ]
+    settings = Settings(
+        aemet_api_key="dummy",
+        database_url="sqlite:///:memory:",
+        request_timeout_seconds=1.0,
+        gabriel_station_id="1",
+        juan_station_id="2",
+        cache_freshness_seconds=3600,
+        station_catalog_freshness_seconds=7 * 24 * 60 * 60,
+    )
+    repo = VersionedRepo(rows)
+    client = FakeClient(rows)
+    service = AntarcticService(settings, repo, client)
+    query = dict(
+        station=Station.GABRIEL_DE_CASTILLA,
+        start_local=datetime(2024, 1, 1, 0, 0, tzinfo=UTC),
+        end_local=datetime(2024, 1, 1, 1, 0, tzinfo=UTC),
+        aggregation=TimeAggregation.HOURLY,
+        selected_types=[],
+    )
+
+    first = service.get_data(**query)
+    second = service.get_data(**query)
+    assert second == first
+    assert repo.read_calls == 1
+
+    # Any write moves the station to a new data version and forces a recompute.
+    repo.upsert_measurements("1", rows, query["start_local"], query["end_local"])
+    service.get_data(**query)
+    assert repo.read_calls == 2
+
+    # A sub-window at the same version is sliced from the cached batch
+    # instead of triggering another repository read.
+    narrower = dict(query, end_local=datetime(2024, 1, 1, 0, 10, tzinfo=UTC))
+    narrowed = service.get_data(**narrower)
+    assert len(narrowed) == 1
+    assert repo.read_calls == 2
+
+
 def test_latest_availability_returns_suggested_window_when_data_found():
     newest = datetime.now(UTC).replace(microsecond=0)
     rows = [